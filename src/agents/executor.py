@@ -1,6 +1,8 @@
 """Executor node for LangGraph workflow routing."""
 
-from typing import Literal, Union
+import logging
+import os
+from typing import List, Literal, Union
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
 from src.agents.state import State
@@ -14,6 +16,11 @@ from src.prompts.executor_prompts import (
 
 logger = setup_workflow_logger()
 
+# Research agents only see their own step's query, so consecutive research
+# steps don't depend on each other and can run concurrently
+PARALLEL_AGENTS = frozenset({"cortex_researcher", "web_researcher"})
+MAX_PARALLEL_AGENTS = int(os.getenv("MAX_PARALLEL_AGENTS", "4"))
+
 
 def executor_node(
     state: State
@@ -24,6 +31,7 @@ def executor_node(
         'web_researcher',
         'chart_generator',
         'synthesizer',
+        'parallel_researchers',
         'response_formatter'
     ]
 ]:
@@ -40,6 +48,7 @@ def executor_node(
     - If replan_flag and replans < MAX_REPLANS → go to planner
     - If plan complete → go to response_formatter
     - If current step complete → advance to next step's agent
+    - Consecutive research steps → run together in parallel_researchers
     - Otherwise → stay on current step's agent
 
     Args:
@@ -49,25 +58,27 @@ def executor_node(
         Command to route to next node
     """
     # LOG: Current state
-    logger.debug("executor_state", extra={
-        "data": {
-            "current_step": state.get("current_step", 1),
-            "replan_flag": state.get("replan_flag", False),
-            "plan_steps": len(state.get("plan", {}))
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("executor_state", extra={
+            "data": {
+                "current_step": state.get("current_step", 1),
+                "replan_flag": state.get("replan_flag", False),
+                "plan_steps": len(state.get("plan", {}))
+            }
+        })
 
     # 1. Check if we need to replan
     if should_replan(state):
         replans = state.get("replans", 0)
 
-        logger.debug("executor_routing", extra={
-            "data": {
-                "decision": "replan",
-                "replans": replans + 1,
-                "reason": "replan_flag set"
-            }
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("executor_routing", extra={
+                "data": {
+                    "decision": "replan",
+                    "replans": replans + 1,
+                    "reason": "replan_flag set"
+                }
+            })
 
         return Command(
             update={
@@ -113,28 +124,40 @@ def executor_node(
     target_agent = plan[step_key]["agent"]
 
     # LOG: DIAGNOSTIC - Check state vs local variable mismatch
-    logger.debug("executor_step_comparison", extra={
-        "data": {
-            "local_current_step": current_step,
-            "state_current_step": state.get("current_step", 1),
-            "target_agent": target_agent,
-            "expected_action": plan[step_key].get("action", "")
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("executor_step_comparison", extra={
+            "data": {
+                "local_current_step": current_step,
+                "state_current_step": state.get("current_step", 1),
+                "target_agent": target_agent,
+                "expected_action": plan[step_key].get("action", "")
+            }
+        })
+
+    # Batch this step with the research steps that directly follow it
+    if target_agent in PARALLEL_AGENTS and MAX_PARALLEL_AGENTS > 1:
+        batch = [current_step]
+        while (len(batch) < MAX_PARALLEL_AGENTS and
+               plan.get(str(batch[-1] + 1), {}).get("agent") in PARALLEL_AGENTS):
+            batch.append(batch[-1] + 1)
+
+        if len(batch) > 1:
+            return _route_parallel(state, plan, batch)
 
     # Pass the incremented current_step explicitly to avoid state mismatch
     agent_query = build_agent_query(state, current_step=current_step)
 
     # LOG: Routing decision
-    logger.debug("executor_routing", extra={
-        "data": {
-            "decision": "route_to_agent",
-            "target_agent": target_agent,
-            "step": current_step,
-            "total_steps": len(plan),
-            "agent_query": agent_query[:100] + "..." if len(agent_query) > 100 else agent_query
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("executor_routing", extra={
+            "data": {
+                "decision": "route_to_agent",
+                "target_agent": target_agent,
+                "step": current_step,
+                "total_steps": len(plan),
+                "agent_query": agent_query[:100] + "..." if len(agent_query) > 100 else agent_query
+            }
+        })
 
     # Map agent names to valid node names
     agent_mapping = {
@@ -158,3 +181,53 @@ def executor_node(
         },
         goto=goto_node
     )
+
+
+def _route_parallel(state: State, plan: dict, steps: List[int]) -> Command:
+    """
+    Route a run of independent research steps to parallel_researchers.
+
+    current_step moves to the last step of the run, so once all answers
+    are back the executor continues after the batch.
+
+    Args:
+        state: Current workflow state
+        plan: Current plan
+        steps: Consecutive step numbers to run together
+
+    Returns:
+        Command routing to the parallel_researchers node
+    """
+    agent_queries = [
+        {
+            "step": step,
+            "agent": plan[str(step)]["agent"],
+            "query": build_agent_query(state, current_step=step)
+        }
+        for step in steps
+    ]
+    agents = [task["agent"] for task in agent_queries]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("executor_routing", extra={
+            "data": {
+                "decision": "route_parallel",
+                "target_agents": agents,
+                "steps": steps,
+                "total_steps": len(plan)
+            }
+        })
+
+    return Command(
+        update={
+            "current_step": steps[-1],
+            "agent_queries": agent_queries,
+            "agent_query": agent_queries[-1]["query"],
+            "last_agent": agents[-1],
+            "messages": [HumanMessage(
+                content=f"Routing to {', '.join(agents)} in parallel (steps {steps[0]}-{steps[-1]})",
+                name="executor"
+            )]
+        },
+        goto="parallel_researchers"
+    )
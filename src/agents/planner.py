@@ -1,5 +1,6 @@
 """Planner node for LangGraph workflow."""
 
+import logging
 from typing import Literal
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
@@ -7,10 +8,15 @@ from src.config.llm_factory import llm_factory
 from src.prompts.planner_prompts import plan_prompt
 from src.agents.state import State
 from src.utils.logger import setup_workflow_logger
+from src.utils.trace_utils import serialize_trace
 import json
+import re
 
 logger = setup_workflow_logger()
 
+# DeepSeek R1 reasoning blocks, stripped before the plan JSON is parsed
+_THINK_TAG_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+
 
 def planner_node(state: State) -> Command[Literal['executor']]:
     """
@@ -33,14 +39,15 @@ def planner_node(state: State) -> Command[Literal['executor']]:
                    reasoning_llm.model_name if hasattr(reasoning_llm, 'model_name') else "unknown"
 
     # LOG: Input query
-    logger.debug("planner_input", extra={
-        "data": {
-            "user_query": user_query,
-            "enabled_agents": state.get("enabled_agents", []),
-            "model_requested": reasoning_model_key or "default",
-            "model_actual": actual_model
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("planner_input", extra={
+            "data": {
+                "user_query": user_query,
+                "enabled_agents": state.get("enabled_agents", []),
+                "model_requested": reasoning_model_key or "default",
+                "model_actual": actual_model
+            }
+        })
 
     # Invoke LLM
     llm_reply = reasoning_llm.invoke([plan_prompt(state)])
@@ -50,8 +57,7 @@ def planner_node(state: State) -> Command[Literal['executor']]:
         content_str = llm_reply.content if isinstance(llm_reply.content, str) else str(llm_reply.content)
 
         # Handle DeepSeek R1 <think> tags
-        import re
-        content_str = re.sub(r'<think>.*?</think>', '', content_str, flags=re.DOTALL)
+        content_str = _THINK_TAG_RE.sub('', content_str)
 
         # Extract JSON
         start_idx = content_str.find('{')
@@ -74,12 +80,13 @@ def planner_node(state: State) -> Command[Literal['executor']]:
         parsed_plan = json.loads(json_str)
 
         # LOG: Generated plan
-        logger.debug("planner_output", extra={
-            "data": {
-                "plan": parsed_plan,
-                "steps": len(parsed_plan)
-            }
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("planner_output", extra={
+                "data": {
+                    "plan": parsed_plan,
+                    "steps": len(parsed_plan)
+                }
+            })
 
     except json.JSONDecodeError as e:
         logger.error("planner_parse_error", extra={
@@ -100,7 +107,7 @@ def planner_node(state: State) -> Command[Literal['executor']]:
         update={
             "plan": parsed_plan,
             "messages": [HumanMessage(
-                content=f"{json.dumps(parsed_plan)}\n\nEXECUTION_TRACE: {json.dumps({'plan': parsed_plan, 'reasoning_model': actual_model, 'steps': len(parsed_plan)})}",
+                content=f"{json.dumps(parsed_plan)}\n\nEXECUTION_TRACE: {serialize_trace({'plan': parsed_plan, 'reasoning_model': actual_model, 'steps': len(parsed_plan)})}",
                 name="replan" if replan else "initial_plan"
             )],
             "user_query": state.get("user_query", state.get("messages", [{}])[0].content if state.get("messages") else ""),
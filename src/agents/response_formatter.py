@@ -1,15 +1,19 @@
 """Response formatter for final API output."""
 
 import json
+import logging
 import re
 from typing import Dict, Any, List
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
 from src.agents.state import State
 from src.utils.logger import setup_workflow_logger
+from src.utils.parse_utils import extract_json_from_marker
 
 logger = setup_workflow_logger()
 
+_JSON_DECODER = json.JSONDecoder()
+
 
 def response_formatter_node(state: State) -> Command:
     """
@@ -42,15 +46,16 @@ def response_formatter_node(state: State) -> Command:
     charts = []
 
     # LOG: Debug chart extraction
-    logger.debug("extracting_charts", extra={
-        "data": {
-            "message_count": len(messages),
-            "chart_messages": [
-                {"name": getattr(msg, "name", "unknown"), "has_chart_spec": "CHART_SPEC" in msg.content if hasattr(msg, "content") else False}
-                for msg in messages if hasattr(msg, "name") and getattr(msg, "name", "") in ["chart_generator", "chart_summarizer"]
-            ]
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("extracting_charts", extra={
+            "data": {
+                "message_count": len(messages),
+                "chart_messages": [
+                    {"name": getattr(msg, "name", "unknown"), "has_chart_spec": "CHART_SPEC" in msg.content if hasattr(msg, "content") else False}
+                    for msg in messages if hasattr(msg, "name") and getattr(msg, "name", "") in ["chart_generator", "chart_summarizer"]
+                ]
+            }
+        })
 
     for msg in messages:
         # Only extract charts from chart_summarizer (it has the preserved CHART_SPEC)
@@ -69,32 +74,21 @@ def response_formatter_node(state: State) -> Command:
                 if json_start == -1:
                     break
 
-                # Extract JSON by counting braces
-                brace_count = 0
-                json_end = json_start
-                for i in range(json_start, len(content)):
-                    if content[i] == '{':
-                        brace_count += 1
-                    elif content[i] == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            json_end = i + 1
-                            break
-
-                if brace_count == 0:  # Found complete JSON
-                    chart_json = content[json_start:json_end]
-                    try:
-                        chart_spec = json.loads(chart_json)
-                        # Add unique ID if not present
-                        if 'id' not in chart_spec:
-                            chart_spec['id'] = f"chart_{len(charts) + 1}"
-                        charts.append(chart_spec)
-                    except json.JSONDecodeError as e:
-                        logger.warning("chart_json_parse_error", extra={
-                            "data": {"error": str(e), "json_preview": chart_json[:200]}
-                        })
+                # Decode the object in place; raw_decode reports where it ends
+                try:
+                    chart_spec, json_end = _JSON_DECODER.raw_decode(content, json_start)
+                except json.JSONDecodeError as e:
+                    logger.warning("chart_json_parse_error", extra={
+                        "data": {"error": str(e), "json_preview": content[json_start:json_start + 200]}
+                    })
+                    chart_start = json_start + 1
+                    continue
 
-                chart_start = json_end if json_end > json_start else chart_start + 1
+                # Add unique ID if not present
+                if 'id' not in chart_spec:
+                    chart_spec['id'] = f"chart_{len(charts) + 1}"
+                charts.append(chart_spec)
+                chart_start = json_end
 
     # Extract execution traces from all agents
     data_sources = []
@@ -102,55 +96,31 @@ def response_formatter_node(state: State) -> Command:
 
 
     for msg in messages:
-        if not hasattr(msg, 'content') or "EXECUTION_TRACE" not in msg.content:
-            continue
-
-        # Find EXECUTION_TRACE marker
-        content = msg.content
-        trace_start = content.find("EXECUTION_TRACE:")
-        if trace_start == -1:
-            continue
-
-        # Extract JSON after marker
-        trace_json_start = trace_start + len("EXECUTION_TRACE:")
-        trace_json = content[trace_json_start:].strip()
+        # Agent nodes attach traces as structured data; the planner (and
+        # older messages) embed them after an EXECUTION_TRACE marker
+        trace_data = (getattr(msg, 'additional_kwargs', None) or {}).get("execution_trace")
 
-        # Find end of JSON by parsing with proper string tracking
-        brace_count = 0
-        in_string = False
-        escape_next = False
-        json_end = 0
-
-        for i, char in enumerate(trace_json):
-            # Handle string escaping
-            if escape_next:
-                escape_next = False
+        if trace_data is None:
+            if not hasattr(msg, 'content') or "EXECUTION_TRACE" not in msg.content:
                 continue
 
-            if char == '\\' and in_string:
-                escape_next = True
+            content = msg.content
+            trace_start = content.find("EXECUTION_TRACE:")
+            if trace_start == -1:
                 continue
 
-            # Track string boundaries
-            if char == '"':
-                in_string = not in_string
+            trace_data = extract_json_from_marker(content, "EXECUTION_TRACE:")
+            if trace_data is None:
+                logger.warning("trace_parse_error", extra={
+                    "data": {
+                        "agent": getattr(msg, "name", "unknown"),
+                        "error": "No valid JSON after EXECUTION_TRACE marker",
+                        "trace_preview": content[trace_start:trace_start + 200]
+                    }
+                })
                 continue
 
-            # Only count braces/brackets outside of strings
-            if not in_string:
-                if char == '{' or char == '[':
-                    brace_count += 1
-                elif char == '}' or char == ']':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        json_end = i + 1
-                        break
-
-        if json_end > 0:
-            trace_json = trace_json[:json_end]
-
         try:
-            trace_data = json.loads(trace_json)
             agent_name = getattr(msg, "name", "unknown")
 
             # Handle different agent types
@@ -233,23 +203,23 @@ def response_formatter_node(state: State) -> Command:
                         "model": trace_data.get("model", "unknown")
                     })
 
-        except (json.JSONDecodeError, KeyError) as e:
+        except KeyError as e:
             logger.warning("trace_parse_error", extra={
                 "data": {
                     "agent": getattr(msg, "name", "unknown"),
-                    "error": str(e),
-                    "trace_preview": trace_json[:200] if 'trace_json' in locals() else ""
+                    "error": str(e)
                 }
             })
             continue
 
     # LOG: Extracted traces
-    logger.debug("traces_extracted", extra={
-        "data": {
-            "total_traces": len(data_sources),
-            "trace_types": [ds.get("type") for ds in data_sources]
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("traces_extracted", extra={
+            "data": {
+                "total_traces": len(data_sources),
+                "trace_types": [ds.get("type") for ds in data_sources]
+            }
+        })
 
     # Build formatted response
     formatted_response = {
@@ -264,14 +234,15 @@ def response_formatter_node(state: State) -> Command:
     }
 
     # LOG: Final response
-    logger.debug("response_formatter_output", extra={
-        "data": {
-            "answer_length": len(formatted_response.get("answer", "")),
-            "charts_count": len(formatted_response.get("charts", [])),
-            "data_sources_count": len(formatted_response.get("data_sources", [])),
-            "models_used": formatted_response.get("metadata", {}).get("models_used", {})
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("response_formatter_output", extra={
+            "data": {
+                "answer_length": len(formatted_response.get("answer", "")),
+                "charts_count": len(formatted_response.get("charts", [])),
+                "data_sources_count": len(formatted_response.get("data_sources", [])),
+                "models_used": formatted_response.get("metadata", {}).get("models_used", {})
+            }
+        })
 
     return Command(
         update={
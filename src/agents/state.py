@@ -25,6 +25,7 @@ class State(MessagesState):
     replans: int = 0
     last_reason: str = ""
     agent_query: str = ""
+    agent_queries: List[Dict[str, Any]] = []  # Steps batched for parallel_researchers
     last_agent: str = ""
     enabled_agents: List[str] = []
 
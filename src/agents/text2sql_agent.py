@@ -1,5 +1,7 @@
 """Text2SQL Agent for querying the OEWS database with ReAct pattern."""
 
+import json
+import logging
 from typing import Dict, Any, List, Optional
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain.agents import create_agent
@@ -11,7 +13,8 @@ from src.tools.database_tools import (
     validate_sql,
     execute_sql_query,
     search_areas,
-    search_occupations
+    search_occupations,
+    resolve_entities
 )
 
 logger = setup_workflow_logger("oews.workflow.text2sql")
@@ -21,6 +24,7 @@ SYSTEM_PROMPT = """You are a Text2SQL expert agent. Your job is to answer questi
 
 1. Understanding the database schema using get_schema_info
 2. Finding exact area/occupation names using search_areas and search_occupations
+   (use resolve_entities to look up several names in a single call)
 3. Validating your SQL queries using validate_sql
 4. Executing queries using execute_sql_query with parameterized queries
 
@@ -82,7 +86,8 @@ def create_text2sql_agent(override_key: Optional[str] = None):
         validate_sql,
         execute_sql_query,
         search_areas,
-        search_occupations
+        search_occupations,
+        resolve_entities
     ]
 
     # Create agent using LangChain 1.0 API
@@ -111,23 +116,25 @@ def _create_simple_agent(llm):
         query = messages[0].get("content", "") if messages else ""
 
         # LOG: Agent input
-        logger.debug("agent_input", extra={
-            "data": {
-                "query": query,
-                "messages_count": len(messages)
-            }
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("agent_input", extra={
+                "data": {
+                    "query": query,
+                    "messages_count": len(messages)
+                }
+            })
 
         try:
             # Get schema
             schema = tools["get_schema_info"].invoke({})
 
             # LOG: Schema retrieved
-            logger.debug("schema_retrieved", extra={
-                "data": {
-                    "schema_length": len(schema)
-                }
-            })
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("schema_retrieved", extra={
+                    "data": {
+                        "schema_length": len(schema)
+                    }
+                })
 
             # Create a prompt for the LLM
             prompt = f"""{SYSTEM_PROMPT}
@@ -143,12 +150,13 @@ Generate a SQL query to answer this question. Return ONLY the SQL query."""
             sql_query = response.content.strip()
 
             # LOG: SQL generated
-            logger.debug("sql_generated", extra={
-                "data": {
-                    "sql": sql_query,
-                    "sql_length": len(sql_query)
-                }
-            })
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("sql_generated", extra={
+                    "data": {
+                        "sql": sql_query,
+                        "sql_length": len(sql_query)
+                    }
+                })
 
             # SECURITY: Validate SQL before execution
             validation_result = tools["validate_sql"].invoke({"sql": sql_query})
@@ -175,20 +183,20 @@ Generate a SQL query to answer this question. Return ONLY the SQL query."""
             result = tools["execute_sql_query"].invoke({"sql": sql_query})
 
             # Parse result to get row count
-            import json
             try:
                 result_data = json.loads(result)
                 row_count = result_data.get("row_count", 0)
                 success = result_data.get("success", False)
 
                 # LOG: Query results
-                logger.debug("query_results", extra={
-                    "data": {
-                        "success": success,
-                        "row_count": row_count,
-                        "result_preview": result[:200] + "..." if len(result) > 200 else result
-                    }
-                })
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("query_results", extra={
+                        "data": {
+                            "success": success,
+                            "row_count": row_count,
+                            "result_preview": result[:200] + "..." if len(result) > 200 else result
+                        }
+                    })
 
             except json.JSONDecodeError:
                 logger.warning("result_parse_error", extra={
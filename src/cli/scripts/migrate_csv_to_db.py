@@ -142,9 +142,13 @@ def create_indexes(conn: sqlite3.Connection) -> None:
         "CREATE INDEX idx_oews_naics_year ON oews_data(NAICS, SURVEY_YEAR);",
         "CREATE INDEX idx_oews_year ON oews_data(SURVEY_YEAR);",
         "CREATE INDEX idx_oews_area_occ_year ON oews_data(AREA, OCC_CODE, SURVEY_YEAR);",
+        # Covering indexes for the DISTINCT title lookups behind search_areas/search_occupations
+        "CREATE INDEX idx_oews_area_title ON oews_data(AREA_TITLE);",
+        "CREATE INDEX idx_oews_occ_title_group ON oews_data(OCC_TITLE, O_GROUP);",
     ]
     for statement in index_statements:
         conn.execute(statement)
+    conn.execute("ANALYZE;")
 
 
 def producer(parquet_path: Path, queue: "Queue[BatchMessage]", batch_size: int) -> None:
@@ -1,6 +1,6 @@
 """Database connection and utilities for OEWS data."""
 
-from .connection import OEWSDatabase
+from .connection import OEWSDatabase, close_shared_databases, get_db
 from .schema import (
     get_table_list,
     get_oews_schema_description,
@@ -9,6 +9,8 @@ from .schema import (
 
 __all__ = [
     "OEWSDatabase",
+    "get_db",
+    "close_shared_databases",
     "get_table_list",
     "get_oews_schema_description",
     "get_all_schemas"
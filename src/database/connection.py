@@ -1,12 +1,23 @@
 """Database connection abstraction for SQLite and Azure SQL with connection pooling."""
 
+import atexit
 import os
-from typing import Literal, Optional, Tuple, Any
+import threading
+from typing import Dict, Literal, List, Optional, Tuple, Any
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.pool import QueuePool, NullPool
 
 
+# Applied to every SQLite connection: 64MB page cache, in-memory temp
+# tables, and 256MB of memory-mapped I/O so hot pages skip pread()
+SQLITE_PRAGMAS = (
+    "PRAGMA cache_size=-65536;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA mmap_size=268435456;",
+)
+
+
 class OEWSDatabase:
     """
     Database abstraction layer for OEWS data.
@@ -17,15 +28,25 @@ class OEWSDatabase:
     SECURITY: All queries must use parameterized queries to prevent SQL injection.
     """
 
-    def __init__(self, environment: Optional[Literal['dev', 'prod']] = None):
+    # Rows pulled per cursor round-trip when streaming bounded results
+    FETCH_SIZE = 1000
+
+    def __init__(
+        self,
+        environment: Optional[Literal['dev', 'prod']] = None,
+        read_only: bool = False
+    ):
         """
         Initialize database connection with pooling.
 
         Args:
             environment: 'dev' for SQLite, 'prod' for Azure SQL.
                         If None, uses DATABASE_ENV environment variable.
+            read_only: Open SQLite in read-only mode (mode=ro, query_only)
+                      so concurrent tool calls only ever take shared locks.
         """
         self.environment = environment or os.getenv('DATABASE_ENV', 'dev')
+        self.read_only = read_only
         self.engine = self._create_engine()
 
     def _create_engine(self):
@@ -36,14 +57,27 @@ class OEWSDatabase:
             SQLAlchemy engine with connection pooling
         """
         if self.environment == 'dev':
-            # SQLite: Use NullPool (SQLite doesn't handle concurrent connections well)
             db_path = os.getenv('SQLITE_DB_PATH', 'data/oews.db')
-            connection_string = f'sqlite:///{db_path}'
-            return create_engine(
-                connection_string,
-                poolclass=NullPool,  # No pooling for SQLite
-                connect_args={'check_same_thread': False}
-            )
+            if self.read_only:
+                # Read-only connections only take shared locks, so keep a small
+                # pool open; reuse skips re-opening the file and keeps each
+                # connection's page cache warm
+                engine = create_engine(
+                    f'sqlite:///file:{db_path}?mode=ro&uri=true',
+                    poolclass=QueuePool,
+                    pool_size=5,
+                    max_overflow=10,
+                    connect_args={'check_same_thread': False}
+                )
+            else:
+                # Writers: NullPool (SQLite doesn't handle concurrent writers well)
+                engine = create_engine(
+                    f'sqlite:///{db_path}',
+                    poolclass=NullPool,  # No pooling for SQLite
+                    connect_args={'check_same_thread': False}
+                )
+            event.listen(engine, "connect", self._apply_sqlite_pragmas)
+            return engine
 
         elif self.environment == 'prod':
             # Azure SQL: Use QueuePool for production
@@ -68,6 +102,17 @@ class OEWSDatabase:
         else:
             raise ValueError(f"Invalid environment: {self.environment}")
 
+    def _apply_sqlite_pragmas(self, dbapi_connection, connection_record) -> None:
+        """Tune each new SQLite connection (and lock it to reads if read_only)."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+            if self.read_only:
+                cursor.execute("PRAGMA query_only=ON;")
+        finally:
+            cursor.close()
+
     def execute_query(
         self,
         sql: str,
@@ -108,6 +153,73 @@ class OEWSDatabase:
                 result = pd.read_sql_query(text(sql), conn)
         return result
 
+    def execute_query_raw(
+        self,
+        sql: str,
+        params: Optional[Tuple[Any, ...]] = None,
+        max_rows: Optional[int] = None
+    ) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """
+        Execute SQL query with parameters and return raw cursor results.
+
+        Skips the pandas DataFrame round-trip for callers that only need
+        JSON-serializable rows (e.g. the execute_sql_query tool). When
+        max_rows is given, rows are streamed in FETCH_SIZE batches and
+        fetching stops once max_rows is reached, so memory stays bounded
+        regardless of how many rows the query matches.
+
+        SECURITY: Uses parameterized queries to prevent SQL injection.
+        All user input MUST be passed via the params argument.
+
+        Args:
+            sql: SQL query string with ? placeholders for parameters
+            params: Tuple of parameter values (optional)
+            max_rows: Stop fetching after this many rows (optional)
+
+        Returns:
+            Tuple of (column names, list of row tuples)
+        """
+        with self.engine.connect() as conn:
+            # Use the raw DBAPI cursor so ? placeholders work positionally
+            cursor = conn.connection.cursor()
+            try:
+                cursor.arraysize = self.FETCH_SIZE
+                cursor.execute(sql, params or ())
+                columns = [col[0] for col in cursor.description or []]
+                if max_rows is None:
+                    rows = [tuple(row) for row in cursor.fetchall()]
+                else:
+                    rows = []
+                    while len(rows) < max_rows:
+                        batch = cursor.fetchmany(min(self.FETCH_SIZE, max_rows - len(rows)))
+                        if not batch:
+                            break
+                        rows.extend(tuple(row) for row in batch)
+            finally:
+                cursor.close()
+        return columns, rows
+
+    def execute_scalar_list(
+        self,
+        sql: str,
+        params: Optional[Tuple[Any, ...]] = None
+    ) -> List[Any]:
+        """
+        Execute SQL query and return the first column as a plain list.
+
+        Suited to lookups like SELECT DISTINCT AREA_TITLE, where a DataFrame
+        would cost more to build than the query itself.
+
+        Args:
+            sql: SQL query string with ? placeholders for parameters
+            params: Tuple of parameter values (optional)
+
+        Returns:
+            List of first-column values, one per row
+        """
+        _, rows = self.execute_query_raw(sql, params=params)
+        return [row[0] for row in rows]
+
     def close(self):
         """Dispose of the connection pool."""
         if self.engine:
@@ -120,3 +232,57 @@ class OEWSDatabase:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+# Shared instances keyed by connection target, reused across tool calls
+_shared_databases: Dict[Tuple[Optional[str], ...], OEWSDatabase] = {}
+_shared_lock = threading.Lock()
+
+
+def _connection_key(environment: str) -> Tuple[Optional[str], ...]:
+    """Identify the database a new OEWSDatabase would connect to."""
+    if environment == 'dev':
+        return (environment, os.getenv('SQLITE_DB_PATH', 'data/oews.db'))
+    return (
+        environment,
+        os.getenv('AZURE_SQL_SERVER'),
+        os.getenv('AZURE_SQL_DATABASE'),
+        os.getenv('AZURE_SQL_USERNAME')
+    )
+
+
+def get_db(environment: Optional[Literal['dev', 'prod']] = None) -> OEWSDatabase:
+    """
+    Return a process-wide OEWSDatabase for the configured connection.
+
+    Engines are thread-safe, so one instance per connection target is shared
+    by all callers. This avoids building (and disposing) an engine and its
+    pool on every query. Shared instances are read-only. Callers must not
+    close the returned instance; it is closed at interpreter exit.
+
+    Args:
+        environment: 'dev' for SQLite, 'prod' for Azure SQL.
+                    If None, uses DATABASE_ENV environment variable.
+
+    Returns:
+        Shared OEWSDatabase instance
+    """
+    environment = environment or os.getenv('DATABASE_ENV', 'dev')
+    key = _connection_key(environment)
+    db = _shared_databases.get(key)
+    if db is None:
+        with _shared_lock:
+            db = _shared_databases.get(key)
+            if db is None:
+                db = OEWSDatabase(environment, read_only=True)
+                _shared_databases[key] = db
+    return db
+
+
+@atexit.register
+def close_shared_databases() -> None:
+    """Dispose every shared OEWSDatabase created by get_db."""
+    with _shared_lock:
+        for db in _shared_databases.values():
+            db.close()
+        _shared_databases.clear()
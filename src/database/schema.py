@@ -75,6 +75,13 @@ Columns:
 """
 
 
+# Descriptions are static; strip and index them once at import
+SCHEMA_DESCRIPTIONS: Dict[str, str] = {
+    'oews_data': OEWS_DATA_SCHEMA.strip(),
+    'data_vintages': DATA_VINTAGES_SCHEMA.strip()
+}
+
+
 def get_table_list() -> List[str]:
     """
     Get list of available tables in the OEWS database.
@@ -101,15 +108,10 @@ def get_oews_schema_description(table_name: str) -> str:
     Raises:
         ValueError: If table name is not recognized
     """
-    schemas = {
-        'oews_data': OEWS_DATA_SCHEMA,
-        'data_vintages': DATA_VINTAGES_SCHEMA
-    }
-
-    if table_name not in schemas:
-        raise ValueError(f"Unknown table: {table_name}. Available: {list(schemas.keys())}")
+    if table_name not in SCHEMA_DESCRIPTIONS:
+        raise ValueError(f"Unknown table: {table_name}. Available: {list(SCHEMA_DESCRIPTIONS.keys())}")
 
-    return schemas[table_name].strip()
+    return SCHEMA_DESCRIPTIONS[table_name]
 
 
 def get_all_schemas() -> str:
@@ -6,7 +6,8 @@ from .database_tools import (
     execute_sql_query,
     get_sample_data,
     search_areas,
-    search_occupations
+    search_occupations,
+    resolve_entities
 )
 
 from .web_research_tools import (
@@ -23,6 +24,7 @@ __all__ = [
     "get_sample_data",
     "search_areas",
     "search_occupations",
+    "resolve_entities",
     # Web research tools
     "tavily_search",
     "get_population_data",
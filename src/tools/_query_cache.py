@@ -0,0 +1,86 @@
+"""In-process result cache for database tools."""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+import sqlparse
+
+# Defaults: OEWS data only changes per release, so minutes of staleness are fine
+DEFAULT_MAXSIZE = 1000
+DEFAULT_TTL_SECONDS = 420.0
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache with per-entry time-to-live.
+
+    Entries are evicted when they expire or when the cache grows past
+    maxsize (least recently used first).
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL_SECONDS):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@functools.lru_cache(maxsize=512)
+def normalize_sql(sql: str) -> str:
+    """
+    Canonicalize SQL text for use as a cache key.
+
+    Strips comments and redundant whitespace and upper-cases keywords, so
+    trivially different spellings of the same query share a cache entry.
+    String literals are left untouched. Memoized, since sqlparse.format
+    re-tokenizes the whole query.
+    """
+    return sqlparse.format(
+        sql,
+        strip_comments=True,
+        strip_whitespace=True,
+        keyword_case='upper'
+    ).rstrip(';').strip()
+
+
+# Shared cache for execute_sql_query results
+query_cache = QueryCache()
@@ -1,14 +1,242 @@
 """Database tools for Text2SQL agent - SECURE IMPLEMENTATION."""
 
+import asyncio
+import functools
+import logging
+import numbers
+import orjson
+import re
 import sqlparse
-from typing import Dict, Any, List, Optional
-from langchain_core.tools import tool
-from src.database.connection import OEWSDatabase
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
+from langchain_core.tools import StructuredTool, tool
+from src.database.connection import OEWSDatabase, get_db
 from src.database.schema import get_oews_schema_description, get_table_list
+from src.tools._query_cache import normalize_sql, query_cache
+from src.utils.fuzzy_matching import (
+    fuzzy_match_area,
+    fuzzy_match_occupation,
+    load_title_lookups
+)
 from src.utils.logger import setup_workflow_logger
 
 logger = setup_workflow_logger("oews.workflow.tools")
 
+# Compact output: results go straight into the LLM context, where
+# indentation only adds tokens
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+
+def _dumps(result: Any) -> str:
+    """Serialize a tool result to compact JSON (orjson handles tuples and numpy scalars natively)."""
+    return orjson.dumps(result, option=_ORJSON_OPTIONS).decode()
+
+
+# Whole-word, case-insensitive match so columns like UPDATED_AT don't trip it
+_DANGEROUS_KEYWORD_RE = re.compile(
+    r'\b(?:DROP|DELETE|UPDATE|INSERT|ALTER|TRUNCATE|CREATE)\b',
+    re.IGNORECASE
+)
+
+# Leading keyword, matched once comments and whitespace are skipped
+_WORD_RE = re.compile(r'[A-Za-z_]+')
+
+_READ_ONLY_KEYWORDS = ('SELECT', 'WITH')
+
+_LIMIT_WORD_RE = re.compile(r'\bLIMIT\b', re.IGNORECASE)
+
+_VALID_SQL_MESSAGE = "Valid: Query syntax is valid. Remember to use ? placeholders for all user inputs."
+
+# Results above this many rows are summarized instead of returned in full
+LARGE_RESULT_THRESHOLD = 1000
+STATS_MAX_COLUMNS = 5
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_sql_cached(sql: str) -> Tuple[Any, ...]:
+    """
+    Parse sql with sqlparse, memoized by the exact SQL text.
+
+    Agents re-issue the same SQL across validate/execute pairs and retries,
+    and sqlparse's tokenizer is slow on long queries. Callers must treat the
+    returned statements as read-only.
+    """
+    return tuple(sqlparse.parse(sql))
+
+
+def _first_keyword(sql: str) -> Optional[str]:
+    """
+    Return the upper-cased first keyword of sql, skipping comments, or None.
+
+    Leading whitespace, '-- ...' and '/* ... */' comments are skipped with a
+    single forward scan, so the cost is linear in len(sql) for any input.
+    An unterminated comment leaves no keyword (None).
+    """
+    pos, end = 0, len(sql)
+    while pos < end:
+        if sql[pos].isspace():
+            pos += 1
+        elif sql.startswith('--', pos):
+            newline = sql.find('\n', pos + 2)
+            if newline == -1:
+                return None
+            pos = newline + 1
+        elif sql.startswith('/*', pos):
+            close = sql.find('*/', pos + 2)
+            if close == -1:
+                return None
+            pos = close + 2
+        else:
+            break
+
+    match = _WORD_RE.match(sql, pos)
+    return match.group(0).upper() if match else None
+
+
+def _may_have_multiple_statements(sql: str) -> bool:
+    """True if sql has a ';' anywhere but at its very end (conservative)."""
+    return ';' in sql.rstrip()[:-1]
+
+
+def _has_top_level_limit(sql: str) -> bool:
+    """
+    True if the outermost query has a LIMIT clause.
+
+    A LIMIT inside a subquery, CTE, comment, string literal or identifier
+    (e.g. LIMITED) doesn't count. The cached parse is only consulted when the
+    word LIMIT appears at all.
+    """
+    if not _LIMIT_WORD_RE.search(sql):
+        return False
+    statements = _parse_sql_cached(sql)
+    return bool(statements) and any(
+        token.ttype in sqlparse.tokens.Keyword and token.normalized == 'LIMIT'
+        for token in statements[0].tokens
+    )
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a result column name for use in a wrapping SELECT."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _numeric_columns(columns: Sequence[str], rows: Sequence[Tuple[Any, ...]]) -> List[str]:
+    """Return columns whose non-null values in rows are all numeric."""
+    numeric = []
+    for idx, col in enumerate(columns):
+        values = [row[idx] for row in rows if row[idx] is not None]
+        if values and all(
+            isinstance(v, numbers.Number) and not isinstance(v, bool) for v in values
+        ):
+            numeric.append(col)
+    return numeric
+
+
+def _summarize_in_database(
+    db: OEWSDatabase,
+    sql: str,
+    params: Optional[Tuple[Any, ...]],
+    numeric_cols: Sequence[str]
+) -> Tuple[int, Dict[str, Dict[str, float]]]:
+    """
+    Compute row count and numeric column stats inside the database.
+
+    Runs one aggregation query (COUNT plus MIN/MAX/AVG per column) over the
+    original query as a subquery, then one UNION ALL query of ORDER BY/OFFSET
+    probes for the medians (SQLite has no MEDIAN aggregate). Nothing beyond
+    the aggregates is pulled into Python.
+
+    Returns:
+        Tuple of (total row count, stats keyed by column name)
+    """
+    # The closing paren goes on its own line so a trailing -- comment in the
+    # user's SQL can't swallow it
+    inner = sql.rstrip().rstrip(';')
+    params = params or ()
+
+    select_parts = ["COUNT(*)"]
+    for col in numeric_cols:
+        q = _quote_identifier(col)
+        select_parts.extend([f"COUNT({q})", f"MIN({q})", f"MAX({q})", f"AVG({q})"])
+
+    _, agg_rows = db.execute_query_raw(
+        f"SELECT {', '.join(select_parts)} FROM ({inner}\n) AS _q",
+        params=params
+    )
+    agg = agg_rows[0]
+    row_count = int(agg[0])
+
+    # Median probes: middle value (or the two middle values for even counts)
+    # of every non-empty column, fetched together in a single round trip
+    probes = []
+    probe_params: List[Any] = []
+    for i, col in enumerate(numeric_cols):
+        non_null = agg[1 + 4 * i]
+        if not non_null:
+            continue
+        q = _quote_identifier(col)
+        probes.append(
+            f"SELECT {i} AS _col, _v FROM (SELECT {q} AS _v FROM ({inner}\n) AS _q "
+            f"WHERE {q} IS NOT NULL ORDER BY {q} LIMIT ? OFFSET ?) AS _m{i}"
+        )
+        probe_params.extend([*params, 2 - non_null % 2, (non_null - 1) // 2])
+
+    middles: Dict[int, List[float]] = {}
+    if probes:
+        _, middle_rows = db.execute_query_raw(
+            " UNION ALL ".join(probes),
+            params=tuple(probe_params)
+        )
+        for col_index, value in middle_rows:
+            middles.setdefault(col_index, []).append(float(value))
+
+    stats = {}
+    for i, col in enumerate(numeric_cols):
+        if i not in middles:
+            continue
+        _, col_min, col_max, col_mean = agg[1 + 4 * i: 5 + 4 * i]
+        stats[col] = {
+            "min": float(col_min),
+            "max": float(col_max),
+            "mean": float(col_mean),
+            "median": sum(middles[i]) / len(middles[i])
+        }
+
+    return row_count, stats
+
+
+# Schema metadata is static for the lifetime of the process
+_cached_table_list = functools.lru_cache(maxsize=1)(get_table_list)
+
+_SCHEMA_OVERVIEW = (
+    f"Available tables: {', '.join(get_table_list())}\n\n"
+    "Use get_schema_info with a specific table_name to see details."
+)
+
+
+# Upper bound on rows returned by get_sample_data
+SAMPLE_DATA_MAX_ROWS = 100
+
+# Maximum names returned by search_areas / search_occupations
+SEARCH_RESULT_LIMIT = 20
+
+
+def _get_lookups() -> Optional[Dict[str, Tuple[str, ...]]]:
+    """Return the in-memory title lookups, or None if they cannot be loaded."""
+    try:
+        return load_title_lookups()
+    except Exception as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("title_lookup_load_failed", extra={
+                "data": {"error": str(e)}
+            })
+        return None
+
+
+def _substring_matches(search_term: str, titles: Sequence[str]) -> List[str]:
+    """Case-insensitive substring scan, equivalent to LIKE '%term%'."""
+    term_lower = search_term.lower()
+    return [t for t in titles if term_lower in t.lower()][:SEARCH_RESULT_LIMIT]
+
 
 @tool
 def get_schema_info(table_name: Optional[str] = None) -> str:
@@ -29,9 +257,7 @@ def get_schema_info(table_name: Optional[str] = None) -> str:
     """
     if table_name:
         return get_oews_schema_description(table_name)
-    else:
-        tables = get_table_list()
-        return f"Available tables: {', '.join(tables)}\n\nUse get_schema_info with a specific table_name to see details."
+    return _SCHEMA_OVERVIEW
 
 
 @tool
@@ -52,37 +278,117 @@ def validate_sql(sql: str) -> str:
     Returns:
         Validation result message
     """
-    import sqlparse
-
     # Basic validation
     if not sql or not sql.strip():
         return "Error: Empty query"
 
     # Check for dangerous operations
-    dangerous = ['DROP', 'DELETE', 'UPDATE', 'INSERT', 'ALTER', 'TRUNCATE', 'CREATE']
-    sql_upper = sql.upper()
-    for keyword in dangerous:
-        if keyword in sql_upper:
-            return f"Error: Dangerous operation '{keyword}' not allowed. Only SELECT queries permitted."
+    match = _DANGEROUS_KEYWORD_RE.search(sql)
+    if match:
+        return f"Error: Dangerous operation '{match.group(0).upper()}' not allowed. Only SELECT queries permitted."
+
+    keyword = _first_keyword(sql)
+    if keyword is not None and keyword not in _READ_ONLY_KEYWORDS:
+        return f"Error: Only SELECT and WITH (CTE) queries are allowed. Got: {keyword}"
 
     # Check for parameterized query patterns (should use ?)
     if "'" in sql or '"' in sql:
         # Warn if using string literals (might be SQL injection risk)
         return "Warning: Query contains string literals. Ensure all user inputs use ? placeholders for safety."
 
+    # Fast path: a plain SELECT/WITH with balanced parentheses needs no parse
+    if keyword is not None and sql.count('(') == sql.count(')'):
+        return _VALID_SQL_MESSAGE
+
     # Parse SQL
     try:
-        parsed = sqlparse.parse(sql)
+        parsed = _parse_sql_cached(sql)
         if not parsed:
             return "Error: Could not parse SQL"
 
-        return "Valid: Query syntax is valid. Remember to use ? placeholders for all user inputs."
+        return _VALID_SQL_MESSAGE
     except Exception as e:
         return f"Error: {str(e)}"
 
 
-@tool
-def execute_sql_query(sql: str, params: Optional[str] = None) -> str:
+def _execute_sql_query_impl(
+    sql: str,
+    params_tuple: Optional[Tuple[Any, ...]] = None,
+    params: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run an already-validated SELECT and build the execute_sql_query result.
+
+    Returns the result dict unserialized so internal callers (the search
+    tools) skip a JSON dump/load round-trip; only the public tool
+    serializes. Database errors propagate to the caller.
+
+    Args:
+        sql: Validated SQL query (defensive LIMIT already applied)
+        params_tuple: Positional parameter values
+        params: Original JSON params string, echoed back in the result
+
+    Returns:
+        Result dict with data (small results) or summary + stats (large)
+    """
+    db = get_db()
+    # Fetch one row past the threshold: enough to tell small from large
+    # results without materializing a large result set in Python
+    columns, rows = db.execute_query_raw(
+        sql, params=params_tuple, max_rows=LARGE_RESULT_THRESHOLD + 1
+    )
+    is_large = len(rows) > LARGE_RESULT_THRESHOLD
+
+    if is_large:
+        numeric_cols = _numeric_columns(columns, rows)[:STATS_MAX_COLUMNS]
+        row_count, stats = _summarize_in_database(db, sql, params_tuple, numeric_cols)
+    else:
+        row_count = len(rows)
+
+    # LOG: Query success
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("sql_execution_success", extra={
+            "data": {
+                "row_count": row_count,
+                "columns": columns if row_count > 0 else [],
+                "sample_data": [dict(zip(columns, row)) for row in rows[:3]]
+            }
+        })
+
+    # Handle large result sets
+    if is_large:
+        # Return summary instead of full data
+        result = {
+            "success": True,
+            "truncated": True,
+            "summary": (
+                f"Query returned {row_count:,} rows (showing first 10). "
+                f"Full dataset available in agent memory for analysis."
+            ),
+            "columns": columns,
+            "sample_data": rows[:10],
+            "row_count": row_count,
+            "sql": sql,
+            "params": params,
+            # Statistics for numeric columns, computed by the database
+            "stats": stats
+        }
+    else:
+        # Return full data for small results (row tuples serialize as arrays)
+        result = {
+            "success": True,
+            "truncated": False,
+            "columns": columns,
+            "data": rows,
+            "row_count": row_count,
+            "sql": sql,
+            "params": params
+        }
+
+    return result
+
+
+def _execute_sql_query(sql: str, params: Optional[str] = None) -> str:
     """
     Execute a SELECT query on the OEWS database.
 
@@ -100,46 +406,41 @@ def execute_sql_query(sql: str, params: Optional[str] = None) -> str:
     Returns:
         JSON string with results or error
     """
-    import json
-
-    # SECURITY: Enforce SELECT-only policy using sqlparse
-    try:
-        statements = sqlparse.parse(sql)
-    except Exception as e:
-        logger.error("sql_parse_error", extra={
-            "data": {"error": str(e), "sql_preview": sql[:100]}
-        })
-        return json.dumps({
-            "success": False,
-            "error": f"SQL parsing error: {str(e)}"
-        })
-
-    # Reject empty SQL
-    if len(statements) == 0:
-        return json.dumps({"success": False, "error": "Empty SQL query"})
-
-    # Reject multiple statements (prevents "SELECT 1; DROP TABLE" attacks)
-    if len(statements) > 1:
-        logger.warning("sql_execution_blocked", extra={
-            "data": {"reason": "multiple_statements", "count": len(statements)}
-        })
-        return json.dumps({
-            "success": False,
-            "error": "Multiple SQL statements not allowed. Only single SELECT or WITH queries permitted."
-        })
-
-    statement = statements[0]
-
-    # Get first token (sqlparse automatically handles whitespace/comments)
-    first_token = statement.token_first(skip_ws=True, skip_cm=True)
-
-    if not first_token:
-        return json.dumps({"success": False, "error": "Could not parse SQL statement"})
+    # SECURITY: Enforce SELECT-only policy. The first keyword comes from a
+    # linear comment-skipping scan; input without one (blank, comment-only,
+    # unterminated comment, leading punctuation) can never be a SELECT, so it
+    # is rejected before sqlparse sees it. sqlparse only runs when a ';' could
+    # separate statements.
+    first_token_value = _first_keyword(sql)
+    if first_token_value is None:
+        if not sql.strip():
+            return _dumps({"success": False, "error": "Empty SQL query"})
+        return _dumps({"success": False, "error": "Could not parse SQL statement"})
+
+    if _may_have_multiple_statements(sql):
+        try:
+            statements = _parse_sql_cached(sql)
+        except Exception as e:
+            logger.error("sql_parse_error", extra={
+                "data": {"error": str(e), "sql_preview": sql[:100]}
+            })
+            return _dumps({
+                "success": False,
+                "error": f"SQL parsing error: {str(e)}"
+            })
 
-    first_token_value = first_token.value.upper()
+        # Reject multiple statements (prevents "SELECT 1; DROP TABLE" attacks)
+        if len(statements) > 1:
+            logger.warning("sql_execution_blocked", extra={
+                "data": {"reason": "multiple_statements", "count": len(statements)}
+            })
+            return _dumps({
+                "success": False,
+                "error": "Multiple SQL statements not allowed. Only single SELECT or WITH queries permitted."
+            })
 
     # Allow SELECT and WITH (CTEs)
-    if first_token_value not in ('SELECT', 'WITH'):
+    if first_token_value not in _READ_ONLY_KEYWORDS:
         logger.warning("sql_execution_blocked", extra={
             "data": {
                 "reason": "non_select_statement",
@@ -147,7 +448,7 @@ def execute_sql_query(sql: str, params: Optional[str] = None) -> str:
                 "sql_preview": sql[:100]
             }
         })
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Only SELECT and WITH (CTE) queries are allowed. Got: {first_token_value}"
         })
@@ -156,96 +457,61 @@ def execute_sql_query(sql: str, params: Optional[str] = None) -> str:
     if first_token_value == 'WITH':
         sql_upper = sql.upper()
         if 'SELECT' not in sql_upper:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": "WITH clause must be followed by SELECT"
             })
 
-    # Add defensive LIMIT if not present
+    # Add defensive LIMIT if the outer query has none
     MAX_ROWS_WITHOUT_LIMIT = 10000
-    if 'LIMIT' not in sql.upper():
+    if not _has_top_level_limit(sql):
         logger.info("sql_adding_defensive_limit", extra={
             "data": {"original_sql_preview": sql[:100]}
         })
-        sql = f"{sql.rstrip().rstrip(';')} LIMIT {MAX_ROWS_WITHOUT_LIMIT}"
+        # Newline so a trailing -- comment can't swallow the clause
+        sql = f"{sql.rstrip().rstrip(';')}\nLIMIT {MAX_ROWS_WITHOUT_LIMIT}"
 
     # LOG: SQL execution start
-    logger.debug("sql_execution_start", extra={
-        "data": {
-            "sql": sql,
-            "params": params,
-            "has_params": params is not None
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("sql_execution_start", extra={
+            "data": {
+                "sql": sql,
+                "params": params,
+                "has_params": params is not None
+            }
+        })
 
     try:
         # Parse params if provided
+        params_list = []
         params_tuple = None
         if params:
-            params_list = json.loads(params)
+            params_list = orjson.loads(params)
             params_tuple = tuple(params_list)
 
-            logger.debug("sql_params_parsed", extra={
-                "data": {
-                    "params_count": len(params_list),
-                    "params": params_list
-                }
-            })
-
-        db = OEWSDatabase()
-        df = db.execute_query(sql, params=params_tuple)
-        db.close()
-
-        row_count = len(df)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("sql_params_parsed", extra={
+                    "data": {
+                        "params_count": len(params_list),
+                        "params": params_list
+                    }
+                })
 
-        # LOG: Query success
-        logger.debug("sql_execution_success", extra={
-            "data": {
-                "row_count": row_count,
-                "columns": df.columns.tolist() if row_count > 0 else [],
-                "sample_data": df.head(3).to_dict('records') if row_count > 0 else []
-            }
-        })
+        # Identical (normalized) queries within the TTL are served from memory
+        cache_key = (normalize_sql(sql), orjson.dumps(params_list))
+        cached = query_cache.get(cache_key)
+        if cached is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("sql_cache_hit", extra={
+                    "data": {"sql_preview": sql[:100]}
+                })
+            return cached
 
-        # Handle large result sets
-        if row_count > 1000:
-            # Return summary instead of full data
-            result = {
-                "success": True,
-                "truncated": True,
-                "summary": (
-                    f"Query returned {row_count:,} rows (showing first 10). "
-                    f"Full dataset available in agent memory for analysis."
-                ),
-                "columns": df.columns.tolist(),
-                "sample_data": df.head(10).values.tolist(),
-                "row_count": row_count,
-                "sql": sql,
-                "params": params,
-                "stats": {
-                    # Provide statistics for numeric columns
-                    col: {
-                        "min": float(df[col].min()),
-                        "max": float(df[col].max()),
-                        "mean": float(df[col].mean()),
-                        "median": float(df[col].median())
-                    }
-                    for col in df.select_dtypes(include=['number']).columns[:5]
-                }
-            }
-        else:
-            # Return full data for small results
-            result = {
-                "success": True,
-                "truncated": False,
-                "columns": df.columns.tolist(),
-                "data": df.values.tolist(),
-                "row_count": row_count,
-                "sql": sql,
-                "params": params
-            }
+        result = _execute_sql_query_impl(sql, params_tuple, params)
 
-        return json.dumps(result, indent=2)
+        response = _dumps(result)
+        query_cache.set(cache_key, response)
+        return response
 
     except Exception as e:
         # LOG: Query error
@@ -264,7 +530,20 @@ def execute_sql_query(sql: str, params: Optional[str] = None) -> str:
             "sql": sql,
             "params": params
         }
-        return json.dumps(result, indent=2)
+        return _dumps(result)
+
+
+async def _aexecute_sql_query(sql: str, params: Optional[str] = None) -> str:
+    """Async variant of execute_sql_query; runs the blocking DB call in a worker thread."""
+    return await asyncio.to_thread(_execute_sql_query, sql, params)
+
+
+# Registered with a coroutine so ainvoke() lets parallel tool calls overlap
+execute_sql_query = StructuredTool.from_function(
+    func=_execute_sql_query,
+    coroutine=_aexecute_sql_query,
+    name="execute_sql_query"
+)
 
 
 @tool
@@ -276,29 +555,51 @@ def get_sample_data(table_name: str, limit: int = 5) -> str:
 
     Args:
         table_name: Name of the table
-        limit: Number of rows to return (default 5)
+        limit: Number of rows to return (default 5, max 100)
 
     Returns:
         JSON string with sample data
     """
-    import json
-    from src.database.schema import get_table_list
-
     # SECURITY: Validate table name against whitelist to prevent SQL injection
-    valid_tables = get_table_list()
+    valid_tables = _cached_table_list()
     if table_name not in valid_tables:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Invalid table name: {table_name}. Valid tables: {', '.join(valid_tables)}"
         })
 
+    # Keep samples small so an oversized limit can't pull the whole table
+    limit = max(1, min(int(limit), SAMPLE_DATA_MAX_ROWS))
+
     # Safe to use table_name now that it's validated
-    sql = f"SELECT * FROM {table_name} LIMIT ?"
-    return execute_sql_query.invoke({"sql": sql, "params": json.dumps([limit])})
+    sql = f"SELECT * FROM {_quote_identifier(table_name)} LIMIT ?"
+    return execute_sql_query.invoke({"sql": sql, "params": _dumps([limit])})
 
 
-@tool
-def search_areas(search_term: str) -> List[str]:
+def _cached_search(
+    tool_name: str,
+    search_term: str,
+    search: Callable[[str], List[str]]
+) -> List[str]:
+    """
+    Serve repeated title searches from the shared result cache.
+
+    Agents often repeat the same lookup across reasoning steps; hits skip
+    fuzzy scoring and any SQL fallback. Empty results are not cached so a
+    transient database error is retried on the next call.
+    """
+    cache_key = (tool_name, search_term)
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    matches = search(search_term)
+    if matches:
+        query_cache.set(cache_key, tuple(matches))
+    return matches
+
+
+def _search_areas(search_term: str) -> List[str]:
     """
     Searches for geographic areas matching the search term.
 
@@ -313,49 +614,71 @@ def search_areas(search_term: str) -> List[str]:
     Returns:
         List of matching area names (up to 20, sorted by relevance)
     """
-    import json
-    from src.utils.fuzzy_matching import fuzzy_match_area
+    return _cached_search("search_areas", search_term, _match_areas)
+
 
+def _match_areas(search_term: str) -> List[str]:
+    """Uncached search_areas body: fuzzy match, then substring/LIKE fallback."""
     # LOG: Search start
-    logger.debug("search_areas_start", extra={
-        "data": {"search_term": search_term}
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("search_areas_start", extra={
+            "data": {"search_term": search_term}
+        })
 
     # First try fuzzy matching for better results
-    fuzzy_matches = fuzzy_match_area(search_term, limit=20)
+    lookups = _get_lookups()
+    fuzzy_matches = fuzzy_match_area(
+        search_term,
+        limit=SEARCH_RESULT_LIMIT,
+        candidates=lookups["areas"] if lookups else None
+    )
 
     if fuzzy_matches:
         # LOG: Fuzzy matches found
-        logger.debug("search_areas_fuzzy_match", extra={
-            "data": {
-                "matches_count": len(fuzzy_matches),
-                "top_match": fuzzy_matches[0] if fuzzy_matches else None
-            }
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("search_areas_fuzzy_match", extra={
+                "data": {
+                    "matches_count": len(fuzzy_matches),
+                    "top_match": fuzzy_matches[0] if fuzzy_matches else None
+                }
+            })
         # Return fuzzy match results (already sorted by relevance)
         return [match["name"] for match in fuzzy_matches]
 
-    # Fallback to SQL LIKE search
-    logger.debug("search_areas_sql_fallback", extra={
-        "data": {"reason": "no_fuzzy_matches"}
-    })
+    # Fallback to LIKE-style substring search (in memory when lookups loaded)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("search_areas_like_fallback", extra={
+            "data": {"reason": "no_fuzzy_matches"}
+        })
+
+    if lookups:
+        return _substring_matches(search_term, lookups["areas"])
 
     sql = "SELECT DISTINCT AREA_TITLE FROM oews_data WHERE AREA_TITLE LIKE ? LIMIT 20"
-    search_param = f"%{search_term}%"
 
-    result_str = execute_sql_query.invoke({
-        "sql": sql,
-        "params": json.dumps([search_param])
-    })
-    result = json.loads(result_str)
+    try:
+        result = _execute_sql_query_impl(sql, (f"%{search_term}%",))
+    except Exception as e:
+        logger.error("sql_execution_error", extra={
+            "data": {"error": str(e), "error_type": type(e).__name__, "sql": sql}
+        })
+        return []
+    return [row[0] for row in result["data"]]
 
-    if result.get("success"):
-        return [row[0] for row in result["data"]]
-    return []
 
+async def _asearch_areas(search_term: str) -> List[str]:
+    """Async variant of search_areas; runs fuzzy matching and SQL in a worker thread."""
+    return await asyncio.to_thread(_search_areas, search_term)
 
-@tool
-def search_occupations(search_term: str) -> List[str]:
+
+search_areas = StructuredTool.from_function(
+    func=_search_areas,
+    coroutine=_asearch_areas,
+    name="search_areas"
+)
+
+
+def _search_occupations(search_term: str) -> List[str]:
     """
     Searches for occupations matching the search term.
 
@@ -370,41 +693,139 @@ def search_occupations(search_term: str) -> List[str]:
     Returns:
         List of matching occupation names (up to 20, sorted by relevance)
     """
-    import json
-    from src.utils.fuzzy_matching import fuzzy_match_occupation
+    return _cached_search("search_occupations", search_term, _match_occupations)
 
+
+def _match_occupations(search_term: str) -> List[str]:
+    """Uncached search_occupations body: fuzzy match, then substring/LIKE fallback."""
     # LOG: Search start
-    logger.debug("search_occupations_start", extra={
-        "data": {"search_term": search_term}
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("search_occupations_start", extra={
+            "data": {"search_term": search_term}
+        })
 
     # First try fuzzy matching
-    fuzzy_matches = fuzzy_match_occupation(search_term, limit=20)
+    lookups = _get_lookups()
+    fuzzy_matches = fuzzy_match_occupation(
+        search_term,
+        limit=SEARCH_RESULT_LIMIT,
+        candidates=lookups["detailed_occupations"] if lookups else None
+    )
 
     if fuzzy_matches:
         # LOG: Fuzzy matches found
-        logger.debug("search_occupations_fuzzy_match", extra={
-            "data": {
-                "matches_count": len(fuzzy_matches),
-                "top_match": fuzzy_matches[0] if fuzzy_matches else None
-            }
-        })
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("search_occupations_fuzzy_match", extra={
+                "data": {
+                    "matches_count": len(fuzzy_matches),
+                    "top_match": fuzzy_matches[0] if fuzzy_matches else None
+                }
+            })
         return [match["name"] for match in fuzzy_matches]
 
-    # Fallback to SQL LIKE search
-    logger.debug("search_occupations_sql_fallback", extra={
-        "data": {"reason": "no_fuzzy_matches"}
-    })
+    # Fallback to LIKE-style substring search (in memory when lookups loaded)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("search_occupations_like_fallback", extra={
+            "data": {"reason": "no_fuzzy_matches"}
+        })
+
+    if lookups:
+        return _substring_matches(search_term, lookups["occupations"])
 
     sql = "SELECT DISTINCT OCC_TITLE FROM oews_data WHERE OCC_TITLE LIKE ? LIMIT 20"
-    search_param = f"%{search_term}%"
 
-    result_str = execute_sql_query.invoke({
-        "sql": sql,
-        "params": json.dumps([search_param])
+    try:
+        result = _execute_sql_query_impl(sql, (f"%{search_term}%",))
+    except Exception as e:
+        logger.error("sql_execution_error", extra={
+            "data": {"error": str(e), "error_type": type(e).__name__, "sql": sql}
+        })
+        return []
+    return [row[0] for row in result["data"]]
+
+
+async def _asearch_occupations(search_term: str) -> List[str]:
+    """Async variant of search_occupations; runs fuzzy matching and SQL in a worker thread."""
+    return await asyncio.to_thread(_search_occupations, search_term)
+
+
+search_occupations = StructuredTool.from_function(
+    func=_search_occupations,
+    coroutine=_asearch_occupations,
+    name="search_occupations"
+)
+
+
+def _parse_entity_payload(payload: str) -> Tuple[List[str], List[str]]:
+    """Parse the resolve_entities payload into area and occupation terms."""
+    data = orjson.loads(payload)
+    if not isinstance(data, dict):
+        raise ValueError("payload must be a JSON object")
+
+    terms = []
+    for key in ("areas", "occupations"):
+        values = data.get(key) or []
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise ValueError(f"'{key}' must be a list of strings")
+        terms.append(values)
+    return terms[0], terms[1]
+
+
+def _entities_result(
+    areas: Sequence[str],
+    occupations: Sequence[str],
+    matches: Sequence[List[str]]
+) -> str:
+    """Serialize resolve_entities matches keyed by search term."""
+    return _dumps({
+        "success": True,
+        "areas": dict(zip(areas, matches[:len(areas)])),
+        "occupations": dict(zip(occupations, matches[len(areas):]))
     })
-    result = json.loads(result_str)
 
-    if result.get("success"):
-        return [row[0] for row in result["data"]]
-    return []
+
+def _resolve_entities(payload: str) -> str:
+    """
+    Resolves several area and occupation names in one call.
+
+    Prefer this over separate search_areas / search_occupations calls when a
+    question mentions more than one place or job.
+
+    Example payload: {"areas": ["Seattle", "Portland"], "occupations": ["nurse"]}
+
+    Args:
+        payload: JSON object with optional "areas" and "occupations" lists
+
+    Returns:
+        JSON string mapping each search term to its matching names
+    """
+    try:
+        areas, occupations = _parse_entity_payload(payload)
+    except ValueError as e:
+        return _dumps({"success": False, "error": f"Invalid payload: {e}"})
+
+    matches = [_search_areas(term) for term in areas]
+    matches += [_search_occupations(term) for term in occupations]
+    return _entities_result(areas, occupations, matches)
+
+
+async def _aresolve_entities(payload: str) -> str:
+    """Async variant of resolve_entities; runs every lookup concurrently."""
+    try:
+        areas, occupations = _parse_entity_payload(payload)
+    except ValueError as e:
+        return _dumps({"success": False, "error": f"Invalid payload: {e}"})
+
+    matches = await asyncio.gather(
+        *[_asearch_areas(term) for term in areas],
+        *[_asearch_occupations(term) for term in occupations]
+    )
+    return _entities_result(areas, occupations, matches)
+
+
+resolve_entities = StructuredTool.from_function(
+    func=_resolve_entities,
+    coroutine=_aresolve_entities,
+    name="resolve_entities"
+)
+
@@ -1,12 +1,26 @@
 """Web research tools using Tavily API."""
 
+import asyncio
+import functools
 import os
 from typing import Optional
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
 
-@tool
-def tavily_search(query: str, max_results: int = 5) -> str:
+@functools.lru_cache(maxsize=4)
+def _tavily_client(api_key: str):
+    """
+    Return a TavilyClient for api_key, created once per key.
+
+    The client owns a requests.Session, so reusing it keeps HTTP
+    connections (and their TLS sessions) alive across searches.
+    """
+    from tavily import TavilyClient
+
+    return TavilyClient(api_key=api_key)
+
+
+def _tavily_search(query: str, max_results: int = 5) -> str:
     """
     Search the web for current information using Tavily.
 
@@ -30,9 +44,7 @@ def tavily_search(query: str, max_results: int = 5) -> str:
         return "Error: TAVILY_API_KEY not found in environment. Please configure API key."
 
     try:
-        from tavily import TavilyClient
-
-        client = TavilyClient(api_key=api_key)
+        client = _tavily_client(api_key)
 
         # Search with context
         response = client.search(
@@ -71,8 +83,20 @@ def tavily_search(query: str, max_results: int = 5) -> str:
         return f"Error searching web: {str(e)}"
 
 
-@tool
-def get_population_data(location: str) -> str:
+async def _atavily_search(query: str, max_results: int = 5) -> str:
+    """Async variant of tavily_search; runs the blocking HTTP call in a worker thread."""
+    return await asyncio.to_thread(_tavily_search, query, max_results)
+
+
+# Registered with a coroutine so ainvoke() lets parallel searches overlap
+tavily_search = StructuredTool.from_function(
+    func=_tavily_search,
+    coroutine=_atavily_search,
+    name="tavily_search"
+)
+
+
+def _get_population_data(location: str) -> str:
     """
     Get current population data for a location using web search.
 
@@ -83,11 +107,22 @@ def get_population_data(location: str) -> str:
         Population information
     """
     query = f"{location} population 2024 census data"
-    return tavily_search.invoke({"query": query, "max_results": 3})
+    return _tavily_search(query, max_results=3)
+
+
+async def _aget_population_data(location: str) -> str:
+    """Async variant of get_population_data."""
+    return await asyncio.to_thread(_get_population_data, location)
+
+
+get_population_data = StructuredTool.from_function(
+    func=_get_population_data,
+    coroutine=_aget_population_data,
+    name="get_population_data"
+)
 
 
-@tool
-def get_cost_of_living_data(location: str) -> str:
+def _get_cost_of_living_data(location: str) -> str:
     """
     Get cost of living information for a location.
 
@@ -98,4 +133,16 @@ def get_cost_of_living_data(location: str) -> str:
         Cost of living information
     """
     query = f"{location} cost of living index 2024"
-    return tavily_search.invoke({"query": query, "max_results": 3})
+    return _tavily_search(query, max_results=3)
+
+
+async def _aget_cost_of_living_data(location: str) -> str:
+    """Async variant of get_cost_of_living_data."""
+    return await asyncio.to_thread(_get_cost_of_living_data, location)
+
+
+get_cost_of_living_data = StructuredTool.from_function(
+    func=_get_cost_of_living_data,
+    coroutine=_aget_cost_of_living_data,
+    name="get_cost_of_living_data"
+)
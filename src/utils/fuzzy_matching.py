@@ -1,19 +1,39 @@
 """Fuzzy string matching utilities for query understanding."""
 
-from typing import List, Dict, Any, Optional
+import functools
+import re
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from rapidfuzz import fuzz, process
-from src.database.connection import OEWSDatabase
+from rapidfuzz.utils import default_process
+from src.database.connection import get_db
+
+
+# Common occupation keywords; matched inside words so plurals ("nurses") count
+_OCCUPATION_KEYWORD_RE = re.compile(
+    "developer|engineer|nurse|teacher|analyst|manager|technician|"
+    "specialist|administrator|designer|programmer|scientist|consultant"
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _processed_choices(candidates: Tuple[str, ...]) -> List[str]:
+    """Normalize a candidate set once so repeated searches reuse it."""
+    return [default_process(candidate) for candidate in candidates]
 
 
 def get_best_matches(
     query: str,
-    candidates: List[str],
+    candidates: Sequence[str],
     limit: int = 5,
     score_threshold: int = 60
 ) -> List[Dict[str, Any]]:
     """
     Find best fuzzy matches from a list of candidates.
 
+    Matching ignores case and punctuation. Candidates are normalized once
+    per distinct candidate set and handed to RapidFuzz as a plain list, so
+    the scoring loop runs entirely in its C++ extension.
+
     Args:
         query: Search query string
         candidates: List of candidate strings to match against
@@ -26,26 +46,63 @@ def get_best_matches(
     if not query or not candidates:
         return []
 
+    candidates = tuple(candidates)
+    choices = _processed_choices(candidates)
+
     # Use RapidFuzz to find best matches
-    # Use token_sort_ratio for better word order independence
+    # WRatio blends full, partial and token-based ratios, so partial names
+    # ("Seattle") and abbreviations ("WA") still score well
     matches = process.extract(
-        query,
-        candidates,
-        scorer=fuzz.token_sort_ratio,
+        default_process(query),
+        choices,
+        scorer=fuzz.WRatio,
         limit=limit,
         score_cutoff=score_threshold
     )
 
     return [
-        {"name": match[0], "score": match[1]}
-        for match in matches
+        {"name": candidates[index], "score": score}
+        for _, score, index in matches
     ]
 
 
+@functools.lru_cache(maxsize=1)
+def load_title_lookups() -> Dict[str, Tuple[str, ...]]:
+    """
+    Load the distinct area and occupation titles once per process.
+
+    The title universe is a few hundred areas and ~800 SOC titles and only
+    changes with a data release, so fuzzy matching and the search tools'
+    substring fallback scan these in memory instead of querying per call.
+    Both lists come from a single UNION ALL query (one statement, one scan
+    setup). A failed load is not cached.
+
+    Returns:
+        Dict with "areas", "occupations" (all groups) and
+        "detailed_occupations" (O_GROUP = 'detailed') title tuples
+    """
+    _, rows = get_db().execute_query_raw(
+        "SELECT DISTINCT 'A', AREA_TITLE, 0 FROM oews_data WHERE AREA_TITLE IS NOT NULL "
+        "UNION ALL "
+        "SELECT DISTINCT 'O', OCC_TITLE, O_GROUP = 'detailed' FROM oews_data "
+        "WHERE OCC_TITLE IS NOT NULL "
+        "ORDER BY 1, 2"
+    )
+
+    areas = [row[1] for row in rows if row[0] == 'A']
+    occupations = [row for row in rows if row[0] == 'O']
+    return {
+        "areas": tuple(areas),
+        "occupations": tuple(dict.fromkeys(row[1] for row in occupations)),
+        "detailed_occupations": tuple(row[1] for row in occupations if row[2]),
+    }
+
+
 def fuzzy_match_area(
     query: str,
     limit: int = 5,
-    score_threshold: int = 60
+    score_threshold: int = 60,
+    candidates: Optional[Sequence[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Find best matching area names from OEWS database using fuzzy matching.
@@ -59,20 +116,16 @@ def fuzzy_match_area(
         query: Area search query
         limit: Maximum number of matches
         score_threshold: Minimum similarity score
+        candidates: Preloaded area names to match against; loaded
+                    from the database (once) when omitted
 
     Returns:
         List of area matches with name and score
     """
     try:
-        db = OEWSDatabase()
-
-        # Get all distinct area names
-        df = db.execute_query(
-            "SELECT DISTINCT AREA_TITLE FROM oews_data LIMIT 1000"
-        )
-        db.close()
-
-        candidates = df['AREA_TITLE'].tolist()
+        if candidates is None:
+            # All distinct area names (loaded once per process)
+            candidates = load_title_lookups()["areas"]
 
         # Find best matches
         matches = get_best_matches(query, candidates, limit, score_threshold)
@@ -87,7 +140,8 @@ def fuzzy_match_area(
 def fuzzy_match_occupation(
     query: str,
     limit: int = 5,
-    score_threshold: int = 60
+    score_threshold: int = 60,
+    candidates: Optional[Sequence[str]] = None
 ) -> List[Dict[str, Any]]:
     """
     Find best matching occupation names from OEWS database using fuzzy matching.
@@ -101,20 +155,16 @@ def fuzzy_match_occupation(
         query: Occupation search query
         limit: Maximum number of matches
         score_threshold: Minimum similarity score
+        candidates: Preloaded occupation names to match against; loaded
+                    from the database (once) when omitted
 
     Returns:
         List of occupation matches with name and score
     """
     try:
-        db = OEWSDatabase()
-
-        # Get all distinct occupation names
-        df = db.execute_query(
-            "SELECT DISTINCT OCC_TITLE FROM oews_data WHERE O_GROUP = 'detailed' LIMIT 1000"
-        )
-        db.close()
-
-        candidates = df['OCC_TITLE'].tolist()
+        if candidates is None:
+            # All distinct detailed occupation names (loaded once per process)
+            candidates = load_title_lookups()["detailed_occupations"]
 
         # Find best matches
         matches = get_best_matches(query, candidates, limit, score_threshold)
@@ -178,26 +228,22 @@ def extract_occupation_from_query(query: str) -> Optional[str]:
     Returns:
         Extracted occupation or None
     """
-    # Common occupation keywords
-    keywords = [
-        "developer", "engineer", "nurse", "teacher", "analyst",
-        "manager", "technician", "specialist", "administrator",
-        "designer", "programmer", "scientist", "consultant"
-    ]
-
     query_lower = query.lower()
 
-    for keyword in keywords:
-        if keyword in query_lower:
-            # Extract surrounding words
-            words = query_lower.split()
-            idx = next(i for i, w in enumerate(words) if keyword in w)
+    # Leftmost keyword in one regex pass
+    match = _OCCUPATION_KEYWORD_RE.search(query_lower)
+    if not match:
+        return None
 
-            # Get 1-2 words before and the keyword
-            start = max(0, idx - 2)
-            end = idx + 1
-            occupation = " ".join(words[start:end])
+    # Index of the word containing the keyword
+    words = query_lower.split()
+    idx = len(query_lower[:match.start()].split())
+    if match.start() > 0 and not query_lower[match.start() - 1].isspace():
+        idx -= 1
 
-            return occupation.strip()
+    # Get 1-2 words before and the keyword
+    start = max(0, idx - 2)
+    end = idx + 1
+    occupation = " ".join(words[start:end])
 
-    return None
+    return occupation.strip()
@@ -1,15 +1,36 @@
 """Structured logging for workflow observability."""
 
 import logging
-import json
+import os
+import time
+import orjson
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any, Dict
 
 
+# Non-string keys and numpy values show up in tool payloads; anything else
+# orjson can't serialize falls back to str() rather than dropping the record
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
 class JsonFormatter(logging.Formatter):
     """Custom formatter that outputs logs as JSON."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted timestamp) reused for records in the same second
+        self._timestamp_cache = (None, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """Format record.created, reusing the string within the same second."""
+        second = int(record.created)
+        cached_second, cached = self._timestamp_cache
+        if second != cached_second:
+            cached = time.strftime("%Y-%m-%dT%H:%M:%S", self.converter(record.created))
+            self._timestamp_cache = (second, cached)
+        return cached
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -21,7 +42,7 @@ class JsonFormatter(logging.Formatter):
             JSON string with timestamp, level, component, event, and optional data
         """
         log_data = {
-            "timestamp": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S"),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "component": record.name,
             "event": record.getMessage(),
@@ -31,7 +52,7 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, 'data'):
             log_data['data'] = record.data
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str, option=_ORJSON_OPTIONS).decode()
 
 
 def setup_workflow_logger(name: str = "oews.workflow") -> logging.Logger:
@@ -40,6 +61,8 @@ def setup_workflow_logger(name: str = "oews.workflow") -> logging.Logger:
 
     Creates logs/ directory if it doesn't exist.
     Configures rotating file handler (10MB files, keep 5).
+    Level defaults to DEBUG; set WORKFLOW_LOG_LEVEL (e.g. INFO) to drop
+    debug events in production.
 
     Args:
         name: Logger name (default: oews.workflow)
@@ -52,7 +75,8 @@ def setup_workflow_logger(name: str = "oews.workflow") -> logging.Logger:
 
     # Get or create logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    level_name = os.getenv("WORKFLOW_LOG_LEVEL", "DEBUG").upper()
+    logger.setLevel(getattr(logging, level_name, logging.DEBUG))
 
     # Avoid adding duplicate handlers
     if logger.handlers:
@@ -3,6 +3,8 @@
 import json
 from typing import Optional, Union, Dict, List, Any
 
+_DECODER = json.JSONDecoder()
+
 
 def extract_json_from_marker(
     text: str,
@@ -41,45 +43,14 @@ def extract_json_from_marker(
     if not json_text:
         return None
 
-    # Find end of JSON by counting braces/brackets with proper string tracking
-    brace_count = 0
-    in_string = False
-    escape_next = False
-    json_end = 0
-
-    for i, char in enumerate(json_text):
-        # Handle string escaping
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == '\\' and in_string:
-            escape_next = True
-            continue
-
-        # Track string boundaries
-        if char == '"':
-            in_string = not in_string
-            continue
-
-        # Only count braces/brackets outside of strings
-        if not in_string:
-            if char == '{' or char == '[':
-                brace_count += 1
-            elif char == '}' or char == ']':
-                brace_count -= 1
-                if brace_count == 0:
-                    json_end = i + 1
-                    break
-
-    if json_end == 0:
-        # No closing brace/bracket found
+    # Only objects and arrays are accepted
+    if json_text[0] not in '{[':
         return None
 
-    # Extract and parse JSON
-    json_text = json_text[:json_end]
-
+    # raw_decode parses the leading value in C and ignores whatever follows
     try:
-        return json.loads(json_text)
+        result, _end = _DECODER.raw_decode(json_text)
     except json.JSONDecodeError:
         return None
+
+    return result
@@ -1,8 +1,12 @@
 """Utilities for building execution traces."""
 
-import json
 from typing import Any, Dict, List, Optional
 
+import orjson
+
+# Longest string kept per field in a trace's sample rows
+MAX_SAMPLE_FIELD_LEN = 512
+
 
 def calculate_column_stats(rows: List[Dict[str, Any]], column: str) -> Optional[Dict[str, Any]]:
     """
@@ -21,32 +25,71 @@ def calculate_column_stats(rows: List[Dict[str, Any]], column: str) -> Optional[
     if not rows or column not in rows[0]:
         return None
 
-    values = []
-    total_count = 0
+    # Single pass: accumulate min/max/sum while converting values
+    count = 0
+    total = 0.0
+    col_min = col_max = 0.0
+    # Once more than half the rows failed, the column can't reach 50% numeric
+    misses_allowed = len(rows) // 2
+    misses = 0
 
     for row in rows:
-        val = row[column]
-        total_count += 1
-
-        # Try to convert to float, skip if not possible
+        # Try to convert to float, skip if not possible (None raises TypeError)
         try:
-            if val is not None:
-                values.append(float(val))
+            num = float(row[column])
         except (ValueError, TypeError):
+            misses += 1
+            if misses > misses_allowed:
+                return None
             continue  # Skip non-numeric values
 
-    if not values:
+        if count == 0:
+            col_min = col_max = num
+        elif num < col_min:
+            col_min = num
+        elif num > col_max:
+            col_max = num
+        total += num
+        count += 1
+
+    if not count:
         return None
 
     # Require at least 50% of values to be numeric to consider column numeric
-    if len(values) < total_count * 0.5:
+    if count < len(rows) * 0.5:
         return None
 
     return {
-        "min": min(values),
-        "max": max(values),
-        "mean": sum(values) / len(values),
-        "count": len(values)  # How many numeric values found
+        "min": col_min,
+        "max": col_max,
+        "mean": total / count,
+        "count": count  # How many numeric values found
+    }
+
+
+def serialize_trace(trace: Any) -> str:
+    """
+    Serialize an execution trace to compact JSON.
+
+    Uses orjson, which also handles numpy scalars and datetimes that
+    can appear in result rows and stats.
+
+    Args:
+        trace: Trace dict or list of trace dicts
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(trace, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _truncate_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shorten long string fields so sample rows keep traces compact."""
+    if not any(isinstance(v, str) and len(v) > MAX_SAMPLE_FIELD_LEN for v in row.values()):
+        return row
+    return {
+        k: v[:MAX_SAMPLE_FIELD_LEN] + "..." if isinstance(v, str) and len(v) > MAX_SAMPLE_FIELD_LEN else v
+        for k, v in row.items()
     }
 
 
@@ -89,7 +132,7 @@ def build_sql_trace(
         "sql": sql,
         "params": params,
         "row_count": row_count,
-        "sample_data": rows[:10],  # First 10 rows
+        "sample_data": [_truncate_row(row) for row in rows[:10]],  # First 10 rows
         "stats": stats,
     }
 
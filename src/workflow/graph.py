@@ -1,51 +1,126 @@
 """LangGraph workflow assembly."""
 
+import functools
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from langchain_core.messages import AIMessage, HumanMessage
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import Command
 from src.agents.state import State
 from src.agents.planner import planner_node
 from src.agents.executor import executor_node
 from src.agents.response_formatter import response_formatter_node
 from src.agents.text2sql_agent import create_text2sql_agent
 from src.agents.chart_generator import create_chart_generator_agent
+from src.agents.web_research_agent import create_web_research_agent
+from src.config.llm_factory import llm_factory
+from src.tools._query_cache import QueryCache
+from src.utils.logger import setup_workflow_logger
+from src.utils.trace_utils import build_sql_trace
 
+# Chart "type" fields inside CHART_SPEC JSON, for the summarizer's one-liner
+_CHART_TYPE_RE = re.compile(r'"type":\s*"(\w+)"')
 
-def cortex_researcher_node(state: State):
-    """Wrapper for Text2SQL agent."""
-    from langgraph.types import Command
-    from langchain_core.messages import AIMessage
-    from src.utils.logger import setup_workflow_logger
-    from src.utils.trace_utils import build_sql_trace
-    import json
+# Per-node loggers, configured once at import
+_LOGGERS = {
+    name: setup_workflow_logger(f"oews.workflow.{name}")
+    for name in ("cortex_researcher", "chart_generator", "web_researcher")
+}
 
-    logger = setup_workflow_logger("oews.workflow.cortex_researcher")
+# Implementation model recorded in usage/traces when no override is given
+DEFAULT_IMPLEMENTATION_MODEL = "deepseek-v3"
 
-    # Get implementation model override from state
-    implementation_model_key = state.get("implementation_model")
+# Most SQL/search traces kept per agent answer; later tool calls are not traced
+MAX_TRACES = 20
 
-    # Create agent with optional override
-    agent = create_text2sql_agent(override_key=implementation_model_key)
-    agent_query = state.get("agent_query", state.get("user_query", ""))
+# Agent messages the synthesizer summarizes
+_SYNTHESIS_SOURCES = frozenset({"cortex_researcher", "web_researcher", "chart_summarizer"})
+
+
+@functools.lru_cache(maxsize=16)
+def _get_agent(factory, override_key=None):
+    """
+    Build an agent once per (factory, model override) and reuse it.
+
+    Agents hold only the LLM client, tool schemas and prompt, none of which
+    change between requests, and invoke() keeps no state on the instance.
+    A factory that raises is not cached, so the next call retries.
+    """
+    return factory(override_key=override_key)
+
+
+# Agent answers for repeated queries (evaluation loops, dashboard refreshes).
+# Set AGENT_RESULT_CACHE_SIZE=0 to disable.
+AGENT_RESULT_CACHE_SIZE = int(os.getenv("AGENT_RESULT_CACHE_SIZE", "256"))
+_agent_result_cache = QueryCache(maxsize=AGENT_RESULT_CACHE_SIZE)
+
+# Queries whose answer depends on when they are asked are never cached
+_TIME_SENSITIVE_RE = re.compile(r'\b(?:now|today|current(?:ly)?|latest)\b', re.IGNORECASE)
+
+
+def _agent_cache_key(node_name: str, model_key: Optional[str], agent_query: str) -> Optional[tuple]:
+    """Cache key for an agent run, or None if the result must not be cached."""
+    if AGENT_RESULT_CACHE_SIZE <= 0 or _TIME_SENSITIVE_RE.search(agent_query):
+        return None
+    return (node_name, model_key, agent_query)
 
-    # LOG: DIAGNOSTIC - Show what query cortex_researcher receives
-    logger.debug("cortex_researcher_input", extra={
-        "data": {
-            "agent_query_from_state": state.get("agent_query", "NOT SET"),
-            "user_query_from_state": state.get("user_query", ""),
-            "current_step_from_state": state.get("current_step", 1),
-            "actual_query_used": agent_query[:200] + "..." if len(agent_query) > 200 else agent_query
-        }
-    })
 
+def clear_agent_result_cache() -> None:
+    """Drop all cached agent answers."""
+    _agent_result_cache.clear()
+
+
+def _resolve_model(state: State) -> str:
+    """Model name recorded for a node: the override, else the default."""
+    return state.get("implementation_model_override") or DEFAULT_IMPLEMENTATION_MODEL
+
+
+def _merge_usage(state: State, node_name: str, model: str) -> Dict[str, str]:
+    """Copy the state's model usage map with this node's model recorded."""
+    usage = state.get("model_usage")
+    usage = dict(usage) if usage else {}
+    usage[node_name] = model
+    return usage
+
+
+def _agent_message(name: str, content: str, trace: Any) -> AIMessage:
+    """
+    Build an agent's reply message with its execution trace attached.
+
+    The trace travels as structured data in additional_kwargs, so the
+    response formatter reads it directly and the synthesizer's prompt,
+    built from message content, never carries trace JSON.
+    """
+    return AIMessage(
+        content=content,
+        name=name,
+        additional_kwargs={"execution_trace": trace} if trace else {}
+    )
+
+
+def _run_cortex_researcher(agent, agent_query: str, logger) -> Tuple[str, Optional[list], bool]:
+    """
+    Run the Text2SQL agent and collect its SQL execution traces.
+
+    Returns:
+        Tuple of (message content, SQL traces or None, whether any SQL query succeeded)
+    """
     # Run agent with correct input format
     result = agent.invoke({"messages": [{"role": "user", "content": agent_query}]})
 
-
     # Extract final answer from messages
     if isinstance(result, dict) and "messages" in result:
         messages = result["messages"]
         if messages and len(messages) > 0:
             last_msg = messages[-1]
-            response_content = last_msg.content if hasattr(last_msg, 'content') else str(last_msg)
+            response_content = getattr(last_msg, 'content', None)
+            if response_content is None:
+                response_content = str(last_msg)
         else:
             response_content = "No messages in result"
     else:
@@ -55,101 +130,123 @@ def cortex_researcher_node(state: State):
     sql_traces = []
     agent_messages = result.get("messages", [])
 
+    # Index tool responses by call id (first response wins) for O(1) pairing
+    responses = {}
+    for msg in agent_messages:
+        tool_call_id = getattr(msg, 'tool_call_id', None)
+        if tool_call_id is not None:
+            responses.setdefault(tool_call_id, msg)
 
     # Iterate through messages to find tool calls and responses
-    for i, msg in enumerate(agent_messages):
+    for msg in agent_messages:
+        if len(sql_traces) >= MAX_TRACES:
+            break
         # Check for AI messages with tool calls
-        if hasattr(msg, 'tool_calls') and msg.tool_calls:
-            for tool_call in msg.tool_calls:
-                if tool_call.get('name') == 'execute_sql_query':
-                    # Found an SQL execution - look for the corresponding ToolMessage response
-                    tool_call_id = tool_call.get('id')
-                    args = tool_call.get('args', {})
-                    sql = args.get('sql', '')
-                    params_str = args.get('params', '[]')
-
-                    try:
-                        params = json.loads(params_str) if params_str else []
-                    except (json.JSONDecodeError, TypeError):
-                        # Handle both JSON parsing errors and type errors (e.g., if params_str is not a string)
-                        params = []
-
-                    # Find the corresponding tool response message
-                    for j in range(i + 1, len(agent_messages)):
-                        next_msg = agent_messages[j]
-                        if (hasattr(next_msg, 'tool_call_id') and
-                            next_msg.tool_call_id == tool_call_id):
-                            # Parse the tool response
-                            try:
-                                result_data = json.loads(next_msg.content) if isinstance(next_msg.content, str) else next_msg.content
-                                if result_data.get("success"):
-                                    # Get columns and data (handle both small and large result sets)
-                                    columns = result_data.get("columns", [])
-                                    # For small results: "data", for large results: "sample_data"
-                                    data_rows = result_data.get("data") or result_data.get("sample_data", [])
-
-                                    # PERFORMANCE: Only convert rows we'll actually use (first 10 for sample_data)
-                                    # build_sql_trace only keeps first 10 rows, so don't convert more than needed
-                                    rows_to_convert = data_rows[:10] if data_rows else []
-                                    rows = [dict(zip(columns, row)) for row in rows_to_convert] if columns and rows_to_convert else []
-
-                                    # Extract metadata from tool response to preserve real row_count and stats
-                                    metadata = {
-                                        "row_count": result_data.get("row_count", len(data_rows)),
-                                        "truncated": result_data.get("truncated", False),
-                                        "stats": result_data.get("stats", None)
-                                    }
-
-                                    sql_traces.append(build_sql_trace(sql, params, rows, metadata))
-                            except (json.JSONDecodeError, AttributeError, KeyError) as e:
-                                logger.warning("sql_trace_extraction_error", extra={
-                                    "data": {"error": str(e)}
-                                })
-                            break
-
-    # Add EXECUTION_TRACE to message content if we have traces
-    if sql_traces:
-        response_content = f"{response_content}\n\nEXECUTION_TRACE: {json.dumps(sql_traces)}"
+        if not getattr(msg, 'tool_calls', None):
+            continue
+        for tool_call in msg.tool_calls:
+            if tool_call.get('name') != 'execute_sql_query' or len(sql_traces) >= MAX_TRACES:
+                continue
 
-    return Command(
-        update={
-            "messages": [AIMessage(content=response_content, name="cortex_researcher")],
-            "model_usage": {
-                **(state.get("model_usage") or {}),
-                "cortex_researcher": state.get("implementation_model_override") or "deepseek-v3"
-            }
-        },
-        goto="executor"
-    )
+            # Found an SQL execution - look up the corresponding ToolMessage response
+            response_msg = responses.get(tool_call.get('id'))
+            if response_msg is None:
+                continue
 
+            args = tool_call.get('args', {})
+            sql = args.get('sql', '')
+            params_str = args.get('params', '[]')
 
-def chart_generator_node(state: State):
-    """Wrapper for Chart Generator agent."""
-    from langgraph.types import Command
-    from langchain_core.messages import AIMessage
-    from src.utils.logger import setup_workflow_logger
-    import json
-    import re
+            try:
+                params = orjson.loads(params_str) if params_str else []
+            except (orjson.JSONDecodeError, TypeError):
+                # Handle both JSON parsing errors and type errors (e.g., if params_str is not a string)
+                params = []
+
+            # Parse the tool response
+            try:
+                result_data = orjson.loads(response_msg.content) if isinstance(response_msg.content, str) else response_msg.content
+                if result_data.get("success"):
+                    # Get columns and data (handle both small and large result sets)
+                    columns = result_data.get("columns", [])
+                    # For small results: "data", for large results: "sample_data"
+                    data_rows = result_data.get("data") or result_data.get("sample_data", [])
+
+                    # PERFORMANCE: Only convert rows we'll actually use (first 10 for sample_data)
+                    # build_sql_trace only keeps first 10 rows, so don't convert more than needed
+                    rows_to_convert = data_rows[:10] if data_rows else []
+                    rows = [dict(zip(columns, row)) for row in rows_to_convert] if columns and rows_to_convert else []
+
+                    # Extract metadata from tool response to preserve real row_count and stats
+                    metadata = {
+                        "row_count": result_data.get("row_count", len(data_rows)),
+                        "truncated": result_data.get("truncated", False),
+                        "stats": result_data.get("stats", None)
+                    }
+
+                    sql_traces.append(build_sql_trace(sql, params, rows, metadata))
+            except (orjson.JSONDecodeError, AttributeError, KeyError) as e:
+                logger.warning("sql_trace_extraction_error", extra={
+                    "data": {"error": str(e)}
+                })
 
-    logger = setup_workflow_logger("oews.workflow.chart_generator")
+    return response_content, sql_traces or None, bool(sql_traces)
+
+
+def cortex_researcher_node(state: State):
+    """Wrapper for Text2SQL agent."""
+    logger = _LOGGERS["cortex_researcher"]
 
     # Get implementation model override from state
     implementation_model_key = state.get("implementation_model")
-    agent = create_chart_generator_agent(override_key=implementation_model_key)
+
     agent_query = state.get("agent_query", state.get("user_query", ""))
 
+    # LOG: DIAGNOSTIC - Show what query cortex_researcher receives
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("cortex_researcher_input", extra={
+            "data": {
+                "agent_query_from_state": state.get("agent_query", "NOT SET"),
+                "user_query_from_state": state.get("user_query", ""),
+                "current_step_from_state": state.get("current_step", 1),
+                "actual_query_used": agent_query[:200] + "..." if len(agent_query) > 200 else agent_query
+            }
+        })
+
+    response_content, trace = _research(
+        "cortex_researcher", create_text2sql_agent, _run_cortex_researcher,
+        implementation_model_key, agent_query, logger
+    )
+
+    return Command(
+        update={
+            "messages": [_agent_message("cortex_researcher", response_content, trace)],
+            "model_usage": _merge_usage(state, "cortex_researcher", _resolve_model(state))
+        },
+        goto="executor"
+    )
+
+
+def _run_chart_generator(agent, agent_query: str, logger, model_key: Optional[str] = None) -> Tuple[str, dict, bool]:
+    """
+    Run the chart generator agent and build its execution trace.
+
+    Returns:
+        Tuple of (response content, execution trace, whether any chart spec was produced)
+    """
     # Run agent with standard message payload
     result = agent.invoke({
         "messages": [{"role": "user", "content": agent_query}]
     })
 
     # LOG: Agent result
-    logger.debug("agent_result", extra={
-        "data": {
-            "result_keys": list(result.keys()) if isinstance(result, dict) else "not a dict",
-            "result_type": str(type(result))
-        }
-    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("agent_result", extra={
+            "data": {
+                "result_keys": list(result.keys()) if isinstance(result, dict) else "not a dict",
+                "result_type": str(type(result))
+            }
+        })
 
     response_content = "No charts generated"
 
@@ -159,33 +256,44 @@ def chart_generator_node(state: State):
             last_msg = messages[-1]
             if isinstance(last_msg, dict):
                 response_content = last_msg.get("content", response_content)
-            elif hasattr(last_msg, "content"):
+            else:
                 response_content = getattr(last_msg, "content", response_content)
         elif "output" in result:
             response_content = result.get("output", response_content)
-    elif hasattr(result, "content"):
+    else:
         response_content = getattr(result, "content", response_content)
 
     # Extract chart count for execution trace
-    chart_count = len(re.findall(r'CHART_SPEC:', response_content))
+    chart_count = response_content.count('CHART_SPEC:')
 
     # Build execution trace
     execution_trace = {
         "action": f"Generated {chart_count} chart specification(s)",
         "chart_count": chart_count,
-        "model": implementation_model_key or "deepseek-v3"
+        "model": model_key or DEFAULT_IMPLEMENTATION_MODEL
     }
 
-    # Append EXECUTION_TRACE to response
-    response_content = f"{response_content}\n\nEXECUTION_TRACE: {json.dumps(execution_trace)}"
+    return response_content, execution_trace, chart_count > 0
+
+
+def chart_generator_node(state: State):
+    """Wrapper for Chart Generator agent."""
+    logger = _LOGGERS["chart_generator"]
+
+    # Get implementation model override from state
+    implementation_model_key = state.get("implementation_model")
+    agent_query = state.get("agent_query", state.get("user_query", ""))
+
+    response_content, trace = _research(
+        "chart_generator", create_chart_generator_agent,
+        functools.partial(_run_chart_generator, model_key=implementation_model_key),
+        implementation_model_key, agent_query, logger
+    )
 
     return Command(
         update={
-            "messages": [AIMessage(content=response_content, name="chart_generator")],
-            "model_usage": {
-                **(state.get("model_usage") or {}),
-                "chart_generator": state.get("implementation_model_override") or "deepseek-v3"
-            }
+            "messages": [_agent_message("chart_generator", response_content, trace)],
+            "model_usage": _merge_usage(state, "chart_generator", _resolve_model(state))
         },
         goto="chart_summarizer"
     )
@@ -193,20 +301,17 @@ def chart_generator_node(state: State):
 
 def chart_summarizer_node(state: State):
     """Describe charts in natural language and preserve CHART_SPEC markers."""
-    from langgraph.types import Command
-    from langchain_core.messages import AIMessage
-
     # Extract chart specs from last message
     messages = state.get("messages", [])
-    last_msg = messages[-1] if messages else None
+    last_content = messages[-1].content if messages else ""
+    spec_start = last_content.find("CHART_SPEC")
 
-    if not last_msg or "CHART_SPEC" not in last_msg.content:
+    if spec_start < 0:
         summary = "No charts were generated."
         content = summary
     else:
-        # Simple extraction of chart type
-        import re
-        chart_types = re.findall(r'"type":\s*"(\w+)"', last_msg.content)
+        # Simple extraction of chart type (specs only, not the preamble)
+        chart_types = _CHART_TYPE_RE.findall(last_content, spec_start)
 
         if chart_types:
             chart_list = ", ".join(chart_types)
@@ -216,7 +321,7 @@ def chart_summarizer_node(state: State):
 
         # CRITICAL: Preserve the original message content with CHART_SPEC markers
         # Append the summary but keep the CHART_SPEC data for response_formatter
-        content = f"{summary}\n\n{last_msg.content}"
+        content = f"{summary}\n\n{last_content}"
 
     return Command(
         update={
@@ -228,11 +333,6 @@ def chart_summarizer_node(state: State):
 
 def synthesizer_node(state: State):
     """Create text summary of all findings."""
-    from langgraph.types import Command
-    from langchain_core.messages import AIMessage, HumanMessage
-    from src.config.llm_factory import llm_factory
-    import json
-
     # Get implementation model with override
     implementation_model_key = state.get("implementation_model")
     impl_llm = llm_factory.get_implementation(override_key=implementation_model_key)
@@ -241,17 +341,16 @@ def synthesizer_node(state: State):
     messages = state.get("messages", [])
     user_query = state.get("user_query", "")
 
-    context = "\n\n".join([
-        f"**{msg.name or 'message'}:** {msg.content}"
-        for msg in messages
-        if hasattr(msg, 'name') and msg.name in ["cortex_researcher", "web_researcher", "chart_summarizer"]
-    ])
-
-    # Check if charts were generated
-    has_charts = any(
-        hasattr(msg, 'name') and msg.name == "chart_summarizer"
-        for msg in messages
-    )
+    # One pass collects agent outputs and notes whether charts were generated
+    parts = []
+    has_charts = False
+    for msg in messages:
+        name = getattr(msg, 'name', None)
+        if name in _SYNTHESIS_SOURCES:
+            parts.append(f"**{name}:** {msg.content}")
+            if name == "chart_summarizer":
+                has_charts = True
+    context = "\n\n".join(parts)
 
     if has_charts:
         prompt = f"""
@@ -293,40 +392,26 @@ Focus on key insights and actionable information with specific numbers and data
         "action": f"Synthesized final answer ({len(response.content)} characters)",
         "answer_length": len(response.content),
         "included_charts": has_charts,
-        "model": implementation_model_key or "deepseek-v3"
+        "model": implementation_model_key or DEFAULT_IMPLEMENTATION_MODEL
     }
 
-    # Append EXECUTION_TRACE to response
-    response_content = f"{response.content}\n\nEXECUTION_TRACE: {json.dumps(execution_trace)}"
-
     return Command(
         update={
-            "messages": [AIMessage(content=response_content, name="synthesizer")],
+            "messages": [_agent_message("synthesizer", response.content, execution_trace)],
             "final_answer": response.content,
-            "model_usage": {
-                **(state.get("model_usage") or {}),
-                "synthesizer": state.get("implementation_model_override") or "deepseek-v3"
-            }
+            "model_usage": _merge_usage(state, "synthesizer", _resolve_model(state))
         },
         goto="executor"
     )
 
 
-def web_researcher_node(state: State):
-    """Web research agent for external data."""
-    from langgraph.types import Command
-    from langchain_core.messages import AIMessage
-    from src.agents.web_research_agent import create_web_research_agent
-    from src.utils.logger import setup_workflow_logger
-    import json
-
-    logger = setup_workflow_logger("oews.workflow.web_researcher")
-
-    # Get implementation model override from state
-    implementation_model_key = state.get("implementation_model")
-    agent = create_web_research_agent(override_key=implementation_model_key)
-    agent_query = state.get("agent_query", state.get("user_query", ""))
+def _run_web_researcher(agent, agent_query: str, logger) -> Tuple[str, Optional[list], bool]:
+    """
+    Run the web research agent and collect its search traces.
 
+    Returns:
+        Tuple of (message content, search traces or None, whether the agent ran its tools)
+    """
     # Run agent
     result = agent.invoke({"messages": [{"role": "user", "content": agent_query}]})
 
@@ -338,6 +423,8 @@ def web_researcher_node(state: State):
     intermediate_steps = result.get("intermediate_steps", [])
 
     for action, observation in intermediate_steps:
+        if len(search_traces) >= MAX_TRACES:
+            break
         # Check if this is a search tool call
         if hasattr(action, 'tool') and 'search' in action.tool.lower():
             try:
@@ -345,7 +432,7 @@ def web_researcher_node(state: State):
 
                 # Parse observation for sources
                 # Tavily returns JSON with results array
-                obs_data = json.loads(observation) if isinstance(observation, str) else observation
+                obs_data = orjson.loads(observation) if isinstance(observation, str) else observation
 
                 sources = []
                 if isinstance(obs_data, dict) and "results" in obs_data:
@@ -360,32 +447,120 @@ def web_researcher_node(state: State):
                     "search_query": search_query,
                     "sources": sources
                 })
-            except (json.JSONDecodeError, AttributeError, KeyError) as e:
+            except (orjson.JSONDecodeError, AttributeError, KeyError) as e:
                 logger.warning("search_trace_extraction_error", extra={
                     "data": {"error": str(e)}
                 })
                 continue
 
-    # Add EXECUTION_TRACE if we have traces
-    if search_traces:
-        response_content = f"{response_content}\n\nEXECUTION_TRACE: {json.dumps(search_traces)}"
+    return response_content, search_traces or None, bool(intermediate_steps)
+
+
+def web_researcher_node(state: State):
+    """Web research agent for external data."""
+    logger = _LOGGERS["web_researcher"]
+
+    # Get implementation model override from state
+    implementation_model_key = state.get("implementation_model")
+    agent_query = state.get("agent_query", state.get("user_query", ""))
+
+    response_content, trace = _research(
+        "web_researcher", create_web_research_agent, _run_web_researcher,
+        implementation_model_key, agent_query, logger
+    )
 
     return Command(
         update={
-            "messages": [AIMessage(content=response_content, name="web_researcher")],
-            "model_usage": {
-                **(state.get("model_usage") or {}),
-                "web_researcher": state.get("implementation_model_override") or "deepseek-v3"
-            }
+            "messages": [_agent_message("web_researcher", response_content, trace)],
+            "model_usage": _merge_usage(state, "web_researcher", _resolve_model(state))
+        },
+        goto="executor"
+    )
+
+
+def _research(node_name: str, factory, runner, model_key: Optional[str], agent_query: str, logger) -> Tuple[str, Any]:
+    """
+    Answer an agent query, reusing a cached answer when possible.
+
+    Repeated queries reuse an earlier answer backed by successful tool
+    calls; otherwise the node's agent runs and its answer is cached.
+
+    Args:
+        node_name: Workflow node the answer is for
+        factory: Agent factory for the node
+        runner: Function running the agent and collecting its execution trace
+        model_key: Optional implementation model override
+        agent_query: Query for the agent
+        logger: Node logger
+
+    Returns:
+        Tuple of (agent answer, execution trace or None)
+    """
+    cache_key = _agent_cache_key(node_name, model_key, agent_query)
+    answer = _agent_result_cache.get(cache_key) if cache_key else None
+    if answer is None:
+        agent = _get_agent(factory, model_key)
+        response_content, trace, succeeded = runner(agent, agent_query, logger)
+        answer = (response_content, trace)
+        if cache_key and succeeded:
+            _agent_result_cache.set(cache_key, answer)
+    return answer
+
+
+def parallel_researchers_node(state: State):
+    """Run consecutive independent research steps concurrently."""
+    implementation_model_key = state.get("implementation_model")
+    tasks = state.get("agent_queries") or []
+
+    researchers = {
+        "cortex_researcher": (create_text2sql_agent, _run_cortex_researcher),
+        "web_researcher": (create_web_research_agent, _run_web_researcher),
+    }
+
+    def run(task):
+        factory, runner = researchers[task["agent"]]
+        logger = _LOGGERS[task["agent"]]
+        try:
+            return _research(task["agent"], factory, runner, implementation_model_key, task["query"], logger)
+        except Exception as e:
+            # One failed branch must not discard its siblings' answers
+            logger.error("parallel_research_error", extra={
+                "data": {"step": task.get("step"), "error": str(e)}
+            })
+            return f"Error: {task['agent']} failed on step {task.get('step')}: {e}", None
+
+    # Agent calls are I/O bound (LLM and tool round trips), so threads overlap them
+    answers = []
+    if tasks:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            answers = list(pool.map(run, tasks))
+
+    model_usage = dict(state.get("model_usage") or {})
+    for task in tasks:
+        model_usage[task["agent"]] = _resolve_model(state)
+
+    # Messages keep plan order so the executor sees the last step's agent last
+    return Command(
+        update={
+            "messages": [
+                _agent_message(task["agent"], content, trace)
+                for task, (content, trace) in zip(tasks, answers)
+            ],
+            "agent_queries": [],
+            "model_usage": model_usage
         },
         goto="executor"
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_workflow_graph():
     """
     Create and compile the complete LangGraph workflow.
 
+    The topology is fixed, so the graph is compiled once per process and
+    the same compiled graph is returned to every caller.
+
     Returns:
         Compiled StateGraph
     """
@@ -400,6 +575,7 @@ def create_workflow_graph():
     graph.add_node("chart_summarizer", chart_summarizer_node)
     graph.add_node("synthesizer", synthesizer_node)
     graph.add_node("web_researcher", web_researcher_node)
+    graph.add_node("parallel_researchers", parallel_researchers_node)
     graph.add_node("response_formatter", response_formatter_node)
 
     # Define edges
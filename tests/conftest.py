@@ -1,3 +1,4 @@
+import shutil
 import sqlite3
 import sys
 from contextlib import contextmanager
@@ -26,12 +27,15 @@ def mock_azure_clients() -> dict[str, MagicMock]:
     }
 
 
-@pytest.fixture
-def sqlite_test_db(tmp_path: Path) -> Path:
-    """Create a throwaway SQLite database populated with a sample table."""
-    db_path = tmp_path / "test.db"
+@pytest.fixture(scope="session")
+def _sqlite_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the sample SQLite database once per session."""
+    db_path = tmp_path_factory.mktemp("sqlite-template") / "test.db"
     connection = sqlite3.connect(db_path)
     try:
+        # Throwaway DB: keep the journal in RAM and skip fsyncs on commit
+        connection.execute("PRAGMA journal_mode=MEMORY")
+        connection.execute("PRAGMA synchronous=OFF")
         connection.execute(
             """
             CREATE TABLE occupations (
@@ -56,6 +60,15 @@ def sqlite_test_db(tmp_path: Path) -> Path:
     return db_path
 
 
+@pytest.fixture
+def sqlite_test_db(tmp_path: Path, _sqlite_template: Path) -> Path:
+    """Create a throwaway SQLite database populated with a sample table."""
+    db_path = tmp_path / "test.db"
+    # Each test gets its own copy, so writes never leak between tests
+    shutil.copyfile(_sqlite_template, db_path)
+    return db_path
+
+
 @contextmanager
 def _mock_connection(name: str) -> Generator[MagicMock, None, None]:
     """Shared helper to provide a mock DB API compliant connection."""
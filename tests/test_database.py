@@ -1,5 +1,5 @@
 import pytest
-from src.database.connection import OEWSDatabase
+from src.database.connection import OEWSDatabase, close_shared_databases, get_db
 
 def test_sqlite_connection_initializes():
     """Test that SQLite database connection can be created."""
@@ -31,3 +31,101 @@ def test_connection_pooling_reuses_connections():
     db = OEWSDatabase(environment='dev')
     # SQLAlchemy engine should have pooling configured
     assert db.engine.pool is not None
+
+def test_execute_query_raw_streams_bounded_batches(tmp_path, monkeypatch):
+    """Test that max_rows caps fetching and batches by FETCH_SIZE."""
+    import sqlite3
+
+    db_path = tmp_path / "stream.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE t (id INTEGER)")
+    connection.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(25)])
+    connection.commit()
+    connection.close()
+    monkeypatch.setenv("SQLITE_DB_PATH", str(db_path))
+
+    db = OEWSDatabase(environment='dev')
+    monkeypatch.setattr(db, "FETCH_SIZE", 4)
+    columns, rows = db.execute_query_raw("SELECT id FROM t ORDER BY id", max_rows=10)
+    _, all_rows = db.execute_query_raw("SELECT id FROM t WHERE id < ?", params=(5,))
+    db.close()
+
+    assert columns == ["id"]
+    assert rows == [(i,) for i in range(10)]
+    assert len(all_rows) == 5
+
+def test_execute_scalar_list_returns_first_column(tmp_path, monkeypatch):
+    """Test execute_scalar_list flattens single-column results into a list."""
+    import sqlite3
+
+    db_path = tmp_path / "scalar.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE t (name TEXT, n INTEGER)")
+    connection.executemany("INSERT INTO t VALUES (?, ?)", [("a", 1), ("b", 2), ("c", 3)])
+    connection.commit()
+    connection.close()
+    monkeypatch.setenv("SQLITE_DB_PATH", str(db_path))
+
+    db = OEWSDatabase(environment='dev')
+    names = db.execute_scalar_list("SELECT name FROM t WHERE n > ? ORDER BY name", params=(1,))
+    db.close()
+
+    assert names == ["b", "c"]
+
+def test_get_db_shares_one_instance_per_database(tmp_path, monkeypatch):
+    """Test that get_db reuses instances and keys them on the target database."""
+    monkeypatch.setenv("SQLITE_DB_PATH", str(tmp_path / "a.db"))
+    first = get_db(environment='dev')
+    assert get_db(environment='dev') is first
+
+    monkeypatch.setenv("SQLITE_DB_PATH", str(tmp_path / "b.db"))
+    other = get_db(environment='dev')
+    assert other is not first
+
+    close_shared_databases()
+    assert get_db(environment='dev') is not other
+    close_shared_databases()
+
+def test_read_only_database_rejects_writes(tmp_path, monkeypatch):
+    """Test read_only connections can query but not modify the database."""
+    import sqlite3
+
+    db_path = tmp_path / "ro.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE t (id INTEGER)")
+    connection.execute("INSERT INTO t VALUES (1)")
+    connection.commit()
+    connection.close()
+    monkeypatch.setenv("SQLITE_DB_PATH", str(db_path))
+
+    db = OEWSDatabase(environment='dev', read_only=True)
+    _, rows = db.execute_query_raw("SELECT id FROM t")
+    _, cache_size = db.execute_query_raw("PRAGMA cache_size")
+    with pytest.raises(sqlite3.OperationalError):
+        db.execute_query_raw("DELETE FROM t")
+    db.close()
+
+    assert rows == [(1,)]
+    assert cache_size == [(-65536,)]
+
+
+def test_read_only_database_reuses_pooled_connections(tmp_path, monkeypatch):
+    """Test sequential read-only queries share one pooled SQLite connection."""
+    import sqlite3
+    from sqlalchemy import event
+
+    db_path = tmp_path / "pool.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE t (id INTEGER)")
+    connection.commit()
+    connection.close()
+    monkeypatch.setenv("SQLITE_DB_PATH", str(db_path))
+
+    db = OEWSDatabase(environment='dev', read_only=True)
+    connects = []
+    event.listen(db.engine, "connect", lambda *args: connects.append(1))
+    for _ in range(3):
+        db.execute_query_raw("SELECT id FROM t")
+    db.close()
+
+    assert len(connects) == 1
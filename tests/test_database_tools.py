@@ -1,11 +1,17 @@
 import pytest
 import os
+from src.database.connection import close_shared_databases
+from src.tools._query_cache import query_cache
+from src.utils.fuzzy_matching import load_title_lookups
 from src.tools.database_tools import (
+    _substring_matches,
     get_schema_info,
     validate_sql,
     execute_sql_query,
+    get_sample_data,
     search_areas,
-    search_occupations
+    search_occupations,
+    resolve_entities
 )
 
 # Check if database is available (either local SQLite or Azure SQL)
@@ -26,6 +32,39 @@ skip_if_no_db = pytest.mark.skipif(
     reason="No database available. Provide either: (1) local SQLite at data/oews.db, or (2) Azure SQL credentials (AZURE_SQL_SERVER, AZURE_SQL_DATABASE, AZURE_SQL_USERNAME, AZURE_SQL_PASSWORD)"
 )
 
+
+@pytest.fixture
+def oews_test_db(tmp_path, monkeypatch):
+    """Point the tools at a small throwaway oews_data table."""
+    import sqlite3
+
+    db_path = tmp_path / "oews.db"
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.execute(
+            "CREATE TABLE oews_data (AREA_TITLE TEXT, OCC_TITLE TEXT, O_GROUP TEXT, TOT_EMP INTEGER, A_MEDIAN REAL)"
+        )
+        connection.executemany(
+            "INSERT INTO oews_data VALUES (?, ?, ?, ?, ?)",
+            [
+                (f"Area {i % 50}", f"Occupation {i % 20}", "detailed", i, 1000.0 * i)
+                for i in range(1, 1501)
+            ],
+        )
+        connection.commit()
+    finally:
+        connection.close()
+
+    monkeypatch.setenv("DATABASE_ENV", "dev")
+    monkeypatch.setenv("SQLITE_DB_PATH", str(db_path))
+    query_cache.clear()
+    load_title_lookups.cache_clear()
+    yield db_path
+    query_cache.clear()
+    load_title_lookups.cache_clear()
+    close_shared_databases()
+
+
 @skip_if_no_db
 def test_get_schema_info_returns_string():
     """Test schema info tool returns description."""
@@ -33,6 +72,16 @@ def test_get_schema_info_returns_string():
     assert isinstance(result, str)
     assert "AREA_TITLE" in result
 
+def test_get_schema_info_is_cached():
+    """Test repeated schema lookups return the prebuilt strings (no DB needed)."""
+    first = get_schema_info.invoke({"table_name": "oews_data"})
+    second = get_schema_info.invoke({"table_name": "oews_data"})
+    overview = get_schema_info.invoke({})
+
+    assert first is second
+    assert overview is get_schema_info.invoke({})
+    assert "oews_data" in overview
+
 def test_validate_sql_accepts_select():
     """Test SQL validation accepts SELECT queries (no DB needed)."""
     result = validate_sql.invoke({"sql": "SELECT * FROM oews_data LIMIT 1"})
@@ -43,6 +92,53 @@ def test_validate_sql_rejects_drop():
     result = validate_sql.invoke({"sql": "DROP TABLE oews_data"})
     assert "dangerous" in result.lower() or "not allowed" in result.lower()
 
+def test_validate_sql_matches_dangerous_keywords_as_whole_words():
+    """Test column names containing a keyword are not flagged (no DB needed)."""
+    result = validate_sql.invoke({"sql": "SELECT UPDATED_AT, created_by FROM oews_data LIMIT 1"})
+    assert result.startswith("Valid")
+
+    result = validate_sql.invoke({"sql": "select 1; delete from oews_data"})
+    assert "'DELETE' not allowed" in result
+
+def test_validate_sql_rejects_non_select_first_keyword():
+    """Test statements that do not start with SELECT/WITH are rejected (no DB needed)."""
+    result = validate_sql.invoke({"sql": "/* hint */ PRAGMA table_info(oews_data)"})
+    assert result == "Error: Only SELECT and WITH (CTE) queries are allowed. Got: PRAGMA"
+
+def test_first_keyword_skips_comments_in_linear_time():
+    """Test the leading-keyword scan handles comments and pathological input quickly (no DB needed)."""
+    import time
+    from src.tools.database_tools import _first_keyword
+
+    assert _first_keyword("-- a\n-- b -- c\n /* x -- y */ select 1") == "SELECT"
+    assert _first_keyword("/* unterminated select 1") is None
+    assert _first_keyword("-- only a comment") is None
+
+    start = time.perf_counter()
+    assert _first_keyword("--" * 50 + "(") is None
+    assert _first_keyword("--" * 100_000 + "\nselect 1") == "SELECT"
+    assert isinstance(validate_sql.invoke({"sql": "--" * 50 + "("}), str)
+    assert time.perf_counter() - start < 1.0
+
+def test_validate_sql_fast_path_skips_sqlparse(monkeypatch):
+    """Test well-formed SELECT/WITH queries are accepted without parsing (no DB needed)."""
+    import src.tools.database_tools as database_tools
+
+    def fail_parse(sql):
+        raise AssertionError("sqlparse should not run on the fast path")
+
+    monkeypatch.setattr(database_tools.sqlparse, "parse", fail_parse)
+    database_tools._parse_sql_cached.cache_clear()
+
+    for sql in (
+        "-- top earners\n/* multi\nline */ select A_MEDIAN FROM oews_data LIMIT 1",
+        "WITH t AS (SELECT 1) SELECT * FROM t",
+    ):
+        assert validate_sql.invoke({"sql": sql}).startswith("Valid")
+
+    # Unbalanced parentheses fall through to the parser
+    assert "should not run" in validate_sql.invoke({"sql": "SELECT COUNT(* FROM oews_data"})
+
 @skip_if_no_db
 def test_execute_sql_query_returns_data():
     """Test SQL execution returns data."""
@@ -97,6 +193,30 @@ def test_search_occupations_with_alternative_name():
     assert len(result) > 0
 
 
+def test_execute_sql_query_rejects_keywordless_input_quickly():
+    """Test comment-only and pathological input is rejected before parsing or touching the DB."""
+    import json
+    import time
+
+    assert json.loads(execute_sql_query.invoke({"sql": "   ", "params": "[]"}))["error"] == "Empty SQL query"
+
+    keywordless = [
+        "-- just a comment",
+        "/* c */",
+        "/* unterminated SELECT 1",
+        "--" * 50 + "(",
+        "/*" * 100_000,
+        "(" * 100_000,
+    ]
+
+    start = time.perf_counter()
+    for sql in keywordless:
+        result_data = json.loads(execute_sql_query.invoke({"sql": sql, "params": "[]"}))
+        assert result_data["success"] is False, f"Should reject: {sql[:20]}"
+        assert result_data["error"] == "Could not parse SQL statement"
+    assert time.perf_counter() - start < 1.0
+
+
 def test_execute_sql_query_blocks_non_select_statements():
     """Test that execute_sql_query blocks dangerous SQL statements."""
     import json
@@ -121,6 +241,26 @@ def test_execute_sql_query_blocks_non_select_statements():
             f"Error should mention allowed statements: {result_data['error']}"
 
 
+def test_execute_sql_query_supports_async_invocation():
+    """Test that tools expose ainvoke so parallel tool calls can overlap (no DB needed)."""
+    import asyncio
+    import json
+
+    async def run_parallel():
+        return await asyncio.gather(
+            execute_sql_query.ainvoke({"sql": "DROP TABLE oews_data", "params": "[]"}),
+            execute_sql_query.ainvoke({"sql": "SELECT 1; SELECT 2", "params": "[]"}),
+        )
+
+    dropped, multi = asyncio.run(run_parallel())
+
+    assert execute_sql_query.coroutine is not None
+    assert search_areas.coroutine is not None
+    assert search_occupations.coroutine is not None
+    assert json.loads(dropped)["success"] is False
+    assert "multiple" in json.loads(multi)["error"].lower()
+
+
 def test_execute_sql_query_allows_select_with_whitespace():
     """Test that SELECT queries with leading whitespace/comments are allowed."""
     import json
@@ -198,3 +338,279 @@ def test_execute_sql_query_adds_default_limit():
         # Should not return more than default limit
         assert result_data["row_count"] <= 10000, \
             "Query without LIMIT should be capped"
+
+
+def test_execute_sql_query_default_limit_ignores_non_clause_limits(oews_test_db):
+    """Test LIMIT in comments, literals, identifiers or subqueries doesn't skip the cap."""
+    import json
+
+    cases = {
+        "SELECT TOT_EMP AS limited FROM oews_data -- LIMIT 5": True,
+        "SELECT * FROM (SELECT TOT_EMP FROM oews_data LIMIT 5000)": True,
+        "SELECT TOT_EMP FROM oews_data WHERE AREA_TITLE != 'LIMIT'": True,
+        "SELECT TOT_EMP FROM oews_data ORDER BY TOT_EMP limit ?": False,
+    }
+    for sql, capped in cases.items():
+        params = "[3]" if "?" in sql else None
+        result = json.loads(execute_sql_query.invoke({"sql": sql, "params": params}))
+        assert result["success"] is True, sql
+        assert result["sql"].endswith("\nLIMIT 10000") is capped, sql
+
+
+def test_execute_sql_query_small_result_returns_rows(oews_test_db):
+    """Test small result sets are returned in full with native value types."""
+    import json
+
+    result = execute_sql_query.invoke({
+        "sql": "SELECT AREA_TITLE, TOT_EMP FROM oews_data WHERE TOT_EMP <= ? ORDER BY TOT_EMP",
+        "params": "[3]"
+    })
+    result_data = json.loads(result)
+
+    assert result_data["success"] is True
+    assert result_data["truncated"] is False
+    assert result_data["columns"] == ["AREA_TITLE", "TOT_EMP"]
+    assert result_data["data"] == [["Area 1", 1], ["Area 2", 2], ["Area 3", 3]]
+    assert '"data":[["Area 1",1],' in result
+
+
+def test_execute_sql_query_large_result_returns_summary(oews_test_db):
+    """Test large result sets are summarized with sample rows and numeric stats."""
+    import json
+
+    result = execute_sql_query.invoke({"sql": "SELECT TOT_EMP, A_MEDIAN FROM oews_data"})
+    result_data = json.loads(result)
+
+    assert result_data["success"] is True
+    assert result_data["truncated"] is True
+    assert result_data["row_count"] == 1500
+    assert len(result_data["sample_data"]) == 10
+    assert result_data["stats"]["TOT_EMP"]["min"] == 1
+    assert result_data["stats"]["TOT_EMP"]["max"] == 1500
+    assert result_data["stats"]["A_MEDIAN"]["mean"] == 750500.0
+    assert result_data["stats"]["TOT_EMP"]["median"] == 750.5
+    assert result_data["stats"]["A_MEDIAN"]["median"] == 750500.0
+
+
+def test_execute_sql_query_large_result_stats_respect_params(oews_test_db):
+    """Test the in-database stats aggregation reuses the query parameters."""
+    import json
+
+    result = execute_sql_query.invoke({
+        "sql": "SELECT AREA_TITLE, TOT_EMP FROM oews_data WHERE TOT_EMP > ?",
+        "params": "[100]"
+    })
+    result_data = json.loads(result)
+
+    assert result_data["row_count"] == 1400
+    assert list(result_data["stats"]) == ["TOT_EMP"]
+    assert result_data["stats"]["TOT_EMP"]["min"] == 101
+    assert result_data["stats"]["TOT_EMP"]["median"] == 800.5
+
+
+def test_execute_sql_query_large_result_with_trailing_comment(oews_test_db):
+    """Test stats wrapping survives a trailing -- comment after a top-level LIMIT."""
+    import json
+
+    result = execute_sql_query.invoke({
+        "sql": "SELECT TOT_EMP FROM oews_data LIMIT 5000 -- all rows"
+    })
+    result_data = json.loads(result)
+
+    assert result_data["success"] is True
+    assert result_data["row_count"] == 1500
+    assert result_data["stats"]["TOT_EMP"]["median"] == 750.5
+
+
+def test_execute_sql_query_serves_repeated_queries_from_cache(oews_test_db):
+    """Test normalized repeats of a query skip the database."""
+    import json
+    import sqlite3
+
+    first = execute_sql_query.invoke({
+        "sql": "SELECT COUNT(*) AS n FROM oews_data WHERE TOT_EMP > ?",
+        "params": "[1000]"
+    })
+
+    connection = sqlite3.connect(oews_test_db)
+    connection.execute("DELETE FROM oews_data")
+    connection.commit()
+    connection.close()
+
+    repeat = execute_sql_query.invoke({
+        "sql": "-- same query\nselect COUNT(*) as n\nFROM oews_data  WHERE TOT_EMP > ?",
+        "params": "[1000]"
+    })
+    other_params = execute_sql_query.invoke({
+        "sql": "SELECT COUNT(*) AS n FROM oews_data WHERE TOT_EMP > ?",
+        "params": "[2000]"
+    })
+
+    assert repeat == first
+    assert json.loads(first)["data"] == [[500]]
+    assert json.loads(other_params)["data"] == [[0]]
+
+
+def test_search_tools_answer_from_in_memory_lookups(oews_test_db):
+    """Test area/occupation searches are served from the preloaded title index."""
+    import sqlite3
+
+    assert search_areas.invoke({"search_term": "Area 7"})[0] == "Area 7"
+
+    connection = sqlite3.connect(oews_test_db)
+    connection.execute("DELETE FROM oews_data")
+    connection.commit()
+    connection.close()
+
+    # Later searches keep working without touching the table
+    assert search_occupations.invoke({"search_term": "Occupation 12"})[0] == "Occupation 12"
+    assert search_areas.invoke({"search_term": "Area 49"})[0] == "Area 49"
+    assert _substring_matches("REA 4", load_title_lookups()["areas"]) == [
+        "Area 4", "Area 40", "Area 41", "Area 42", "Area 43",
+        "Area 44", "Area 45", "Area 46", "Area 47", "Area 48", "Area 49"
+    ]
+
+
+def test_load_title_lookups_partitions_titles_from_one_query(oews_test_db):
+    """Test area, occupation and detailed-occupation lists are split correctly."""
+    import sqlite3
+
+    connection = sqlite3.connect(oews_test_db)
+    connection.execute(
+        "INSERT INTO oews_data VALUES ('Area 0', 'All Occupations', 'total', 1, 1.0)"
+    )
+    connection.commit()
+    connection.close()
+
+    lookups = load_title_lookups()
+
+    assert lookups["areas"] == tuple(sorted(f"Area {i}" for i in range(50)))
+    assert "All Occupations" in lookups["occupations"]
+    assert "All Occupations" not in lookups["detailed_occupations"]
+    assert lookups["detailed_occupations"] == tuple(sorted(f"Occupation {i}" for i in range(20)))
+
+
+def test_database_tools_have_single_canonical_module():
+    """Test every database tool is defined in src/tools/database_tools.py."""
+    import inspect
+    from pathlib import Path
+    import src.tools as tools
+
+    for name in ("get_schema_info", "validate_sql", "execute_sql_query",
+                 "get_sample_data", "search_areas", "search_occupations",
+                 "resolve_entities"):
+        source = Path(inspect.getsourcefile(getattr(tools, name).func))
+        assert source.parts[-3:] == ("src", "tools", "database_tools.py")
+
+
+def test_resolve_entities_batches_area_and_occupation_lookups(oews_test_db):
+    """Test one resolve_entities call answers every term, sync and async."""
+    import asyncio
+    import json
+
+    payload = json.dumps({"areas": ["Area 7", "Area 12"], "occupations": ["Occupation 3"]})
+
+    result = json.loads(resolve_entities.invoke({"payload": payload}))
+    async_result = json.loads(asyncio.run(resolve_entities.ainvoke({"payload": payload})))
+
+    assert result == async_result
+    assert result["success"] is True
+    assert result["areas"]["Area 7"][0] == "Area 7"
+    assert result["areas"]["Area 12"][0] == "Area 12"
+    assert result["occupations"]["Occupation 3"][0] == "Occupation 3"
+
+
+def test_resolve_entities_rejects_malformed_payload():
+    """Test resolve_entities reports bad payloads instead of raising (no DB needed)."""
+    import json
+
+    for payload in ("not json", "[1, 2]", '{"areas": "Seattle"}'):
+        result = json.loads(resolve_entities.invoke({"payload": payload}))
+        assert result["success"] is False
+        assert "Invalid payload" in result["error"]
+
+
+def test_search_sql_fallback_skips_tool_serialization(oews_test_db, monkeypatch):
+    """Test the LIKE fallback queries directly instead of via the JSON tool."""
+    import src.tools.database_tools as database_tools
+
+    def fail_invoke(*args, **kwargs):
+        raise AssertionError("search fallback should not go through execute_sql_query")
+
+    monkeypatch.setattr(database_tools, "_get_lookups", lambda: None)
+    monkeypatch.setattr(database_tools, "fuzzy_match_area", lambda *a, **k: [])
+    monkeypatch.setattr(type(execute_sql_query), "invoke", fail_invoke)
+
+    assert sorted(search_areas.func("Area 4")) == [
+        "Area 4", "Area 40", "Area 41", "Area 42", "Area 43",
+        "Area 44", "Area 45", "Area 46", "Area 47", "Area 48", "Area 49"
+    ]
+
+
+def test_repeated_searches_are_served_from_cache(oews_test_db, monkeypatch):
+    """Test an identical search skips fuzzy matching on the second call."""
+    import src.tools.database_tools as database_tools
+
+    calls = []
+    real_fuzzy_match_area = database_tools.fuzzy_match_area
+
+    def counting_fuzzy_match_area(*args, **kwargs):
+        calls.append(args[0])
+        return real_fuzzy_match_area(*args, **kwargs)
+
+    monkeypatch.setattr(database_tools, "fuzzy_match_area", counting_fuzzy_match_area)
+
+    first = search_areas.invoke({"search_term": "Area 7"})
+    second = search_areas.invoke({"search_term": "Area 7"})
+    search_areas.invoke({"search_term": "Area 8"})
+
+    assert first == second
+    assert calls == ["Area 7", "Area 8"]
+
+
+def test_get_sample_data_clamps_limit_and_rejects_unknown_tables(oews_test_db):
+    """Test get_sample_data caps the row count and whitelists table names."""
+    import json
+
+    large = json.loads(get_sample_data.invoke({"table_name": "oews_data", "limit": 10_000_000}))
+    small = json.loads(get_sample_data.invoke({"table_name": "oews_data", "limit": 0}))
+    unknown = json.loads(get_sample_data.invoke({"table_name": "oews_data; DROP TABLE x", "limit": 5}))
+
+    assert large["row_count"] == 100
+    assert small["row_count"] == 1
+    assert unknown["success"] is False
+    assert "Invalid table name" in unknown["error"]
+
+
+def test_validate_then_execute_parses_sql_once(oews_test_db):
+    """Test a validate/execute pair runs sqlparse at most once."""
+    from src.tools.database_tools import _parse_sql_cached
+
+    # The ")" in the comment unbalances the naive paren count, forcing a full parse
+    sql = "SELECT COUNT(* ) FROM oews_data WHERE TOT_EMP > ? LIMIT 1 -- )"
+    _parse_sql_cached.cache_clear()
+
+    validate_sql.invoke({"sql": sql})
+    execute_sql_query.invoke({"sql": sql, "params": "[10]"})
+
+    assert _parse_sql_cached.cache_info().misses == 1
+
+
+def test_execute_sql_query_gate_uses_sqlparse_only_when_ambiguous(oews_test_db):
+    """Test the SELECT-only gate skips sqlparse unless a ';' could split statements."""
+    import json
+    from src.tools.database_tools import _parse_sql_cached
+
+    _parse_sql_cached.cache_clear()
+
+    ok = json.loads(execute_sql_query.invoke({"sql": "/* c */ SELECT COUNT(*) FROM oews_data;"}))
+    blocked = json.loads(execute_sql_query.invoke({"sql": "-- note\nPRAGMA user_version"}))
+    assert _parse_sql_cached.cache_info().misses == 0
+
+    multi = json.loads(execute_sql_query.invoke({"sql": "SELECT 1; DELETE FROM oews_data"}))
+    assert _parse_sql_cached.cache_info().misses == 1
+
+    assert ok["data"] == [[1500]]
+    assert blocked["error"] == "Only SELECT and WITH (CTE) queries are allowed. Got: PRAGMA"
+    assert "Multiple SQL statements not allowed" in multi["error"]
+
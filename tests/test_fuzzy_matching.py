@@ -1,6 +1,7 @@
 import pytest
 from src.utils.fuzzy_matching import (
     fuzzy_match_area,
+    extract_occupation_from_query,
     fuzzy_match_occupation,
     get_best_matches
 )
@@ -80,3 +81,70 @@ def test_get_best_matches_returns_top_n():
     # If we have at least 2 matches, verify they're sorted by score
     if len(matches) >= 2:
         assert matches[0]["score"] >= matches[1]["score"]
+
+
+def test_get_best_matches_is_case_insensitive():
+    """Test that matching ignores case but returns original names."""
+    candidates = ("Software Developers", "Registered Nurses")
+
+    matches = get_best_matches("SOFTWARE developers", candidates, limit=1)
+
+    assert matches == [{"name": "Software Developers", "score": 100.0}]
+
+
+def test_get_best_matches_handles_partial_names_and_abbreviations():
+    """Test partial names and state abbreviations clear the default threshold."""
+    candidates = [
+        "Seattle-Tacoma-Bellevue, WA",
+        "Bellingham, WA",
+        "Portland-Vancouver-Hillsboro, OR-WA",
+        "San Francisco-Oakland-Hayward, CA"
+    ]
+
+    seattle = get_best_matches("Seattle", candidates)
+    washington = get_best_matches("WA", candidates)
+
+    assert seattle[0]["name"] == "Seattle-Tacoma-Bellevue, WA"
+    assert {"Seattle-Tacoma-Bellevue, WA", "Bellingham, WA"} <= {m["name"] for m in washington}
+
+
+def test_fuzzy_match_candidates_are_loaded_once(tmp_path, monkeypatch):
+    """Test candidate names are queried once and reused across calls."""
+    import sqlite3
+    from src.database.connection import close_shared_databases
+    from src.utils import fuzzy_matching
+
+    db_path = tmp_path / "oews.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute("CREATE TABLE oews_data (AREA_TITLE TEXT, OCC_TITLE TEXT, O_GROUP TEXT)")
+    connection.executemany(
+        "INSERT INTO oews_data VALUES (?, ?, ?)",
+        [("Seattle-Tacoma-Bellevue, WA", "Software Developers", "detailed"),
+         ("Bellingham, WA", "Registered Nurses", "detailed")],
+    )
+    connection.commit()
+    monkeypatch.setenv("DATABASE_ENV", "dev")
+    monkeypatch.setenv("SQLITE_DB_PATH", str(db_path))
+    fuzzy_matching.load_title_lookups.cache_clear()
+
+    try:
+        assert fuzzy_match_area("bellingham wa")[0]["name"] == "Bellingham, WA"
+        assert fuzzy_match_occupation("software developer")[0]["name"] == "Software Developers"
+
+        connection.execute("DELETE FROM oews_data")
+        connection.commit()
+
+        assert fuzzy_match_area("seattle tacoma bellevue wa")[0]["name"] == "Seattle-Tacoma-Bellevue, WA"
+        assert fuzzy_matching.load_title_lookups.cache_info().misses == 1
+    finally:
+        connection.close()
+        fuzzy_matching.load_title_lookups.cache_clear()
+        close_shared_databases()
+
+
+def test_extract_occupation_from_query_keeps_preceding_words():
+    """Test the keyword scan returns the keyword word plus up to two words before it."""
+    assert extract_occupation_from_query("Senior software developer salaries") == "senior software developer"
+    assert extract_occupation_from_query("How much do nurses make?") == "much do nurses"
+    assert extract_occupation_from_query("salaries for web-developers in Seattle") == "salaries for web-developers"
+    assert extract_occupation_from_query("median wage in Seattle") is None
@@ -60,3 +60,36 @@ def test_json_formatter_includes_timestamp():
     assert "timestamp" in log_data
     assert "level" in log_data
     assert "component" in log_data
+
+
+def test_logger_level_honours_workflow_log_level(monkeypatch):
+    """Test that WORKFLOW_LOG_LEVEL disables debug events when raised."""
+    monkeypatch.setenv("WORKFLOW_LOG_LEVEL", "info")
+    logger = setup_workflow_logger("oews.workflow.test_level")
+
+    assert logger.level == logging.INFO
+    assert not logger.isEnabledFor(logging.DEBUG)
+
+    monkeypatch.delenv("WORKFLOW_LOG_LEVEL")
+    assert setup_workflow_logger("oews.workflow.test_level").level == logging.DEBUG
+
+
+
+def test_json_formatter_serializes_tool_payloads():
+    """Test timestamps match formatTime and odd payload types still serialize."""
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        name="test",
+        level=logging.DEBUG,
+        pathname="",
+        lineno=0,
+        msg="sql_execution_success",
+        args=(),
+        exc_info=None
+    )
+    record.data = {"rows": [(1, "a")], 7: "int key", "path": Path("logs")}
+
+    log_data = json.loads(formatter.format(record))
+
+    assert log_data["timestamp"] == formatter.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S")
+    assert log_data["data"] == {"rows": [[1, "a"]], "7": "int key", "path": "logs"}
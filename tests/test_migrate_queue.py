@@ -6,3 +6,22 @@ def test_batch_message_kind_is_enum():
 
     assert issubclass(MessageKind, Enum)
     assert BatchMessage.__annotations__["kind"] is MessageKind
+
+
+def test_create_indexes_covers_title_lookups(tmp_path):
+    from src.cli.scripts.migrate_csv_to_db import create_indexes, setup_database  # noqa: PLC0415
+
+    conn = setup_database(tmp_path / "oews.db")
+    create_indexes(conn)
+
+    plans = [
+        " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+        for sql in (
+            "SELECT DISTINCT AREA_TITLE FROM oews_data",
+            "SELECT DISTINCT OCC_TITLE, O_GROUP = 'detailed' FROM oews_data",
+        )
+    ]
+    conn.close()
+
+    assert "COVERING INDEX idx_oews_area_title" in plans[0]
+    assert "COVERING INDEX idx_oews_occ_title_group" in plans[1]
@@ -180,3 +180,9 @@ class TestExtractJsonFromMarker:
         result = extract_json_from_marker(text, "MARKER:")
 
         assert result == {"text": "line1\nline2"}
+
+    def test_brackets_inside_strings_are_ignored(self):
+        """Braces and brackets inside string values do not affect nesting."""
+        text = 'MARKER: {"sql": "SELECT \'{[\' || x", "note": "a \\\\\\" }"} trailing }'
+        result = extract_json_from_marker(text, "MARKER:")
+        assert result == {"sql": "SELECT '{[' || x", "note": 'a \\" }'}
@@ -0,0 +1,41 @@
+"""Tests for the database tool result cache."""
+
+from src.tools._query_cache import QueryCache, normalize_sql
+
+
+def test_query_cache_returns_stored_value():
+    """Test basic set/get round trip."""
+    cache = QueryCache(maxsize=2, ttl=60)
+    cache.set("a", "result")
+
+    assert cache.get("a") == "result"
+    assert cache.get("missing") is None
+
+
+def test_query_cache_evicts_least_recently_used():
+    """Test that the oldest unused entry is evicted when full."""
+    cache = QueryCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_query_cache_expires_entries():
+    """Test that entries past their TTL are dropped (ttl=0 expires immediately)."""
+    cache = QueryCache(maxsize=2, ttl=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_normalize_sql_ignores_case_comments_and_whitespace():
+    """Test that trivially different spellings share a key but literals do not."""
+    assert normalize_sql("select *\n  from oews_data -- note\n;") == \
+        normalize_sql("SELECT * FROM oews_data")
+    assert normalize_sql("SELECT 'a  b'") != normalize_sql("SELECT 'a b'")
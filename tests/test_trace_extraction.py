@@ -11,7 +11,7 @@ import pytest
 from unittest.mock import Mock, MagicMock
 from langchain_core.messages import AIMessage, ToolMessage
 from src.utils.trace_utils import build_sql_trace
-from src.workflow.graph import cortex_researcher_node
+from src.workflow.graph import chart_summarizer_node, cortex_researcher_node
 from src.agents.response_formatter import response_formatter_node
 from src.agents.state import State
 
@@ -131,6 +131,33 @@ class TestTraceFormatterIntegration:
         assert sql_trace["agent"] == "cortex_researcher"
         assert sql_trace["row_count"] == 10
 
+    def test_formatter_reads_structured_traces_in_message_order(self):
+        """Test traces attached to agent messages are used without parsing content."""
+        from src.workflow.graph import _agent_message
+
+        sql_trace = {"sql": "SELECT 1", "params": [], "row_count": 1, "sample_data": [{"v": 1}]}
+        search_trace = {"search_query": "seattle rent", "sources": []}
+        state = State(
+            messages=[
+                _agent_message("cortex_researcher", "Found wages.", [sql_trace]),
+                _agent_message("web_researcher", "Found rent.", [search_trace]),
+                _agent_message("synthesizer", "Answer.", {"answer_length": 7, "model": "m"}),
+            ],
+            final_answer="Answer.",
+            plan={},
+            model_usage={}
+        )
+
+        formatted = response_formatter_node(state).update["formatted_response"]
+
+        assert [(d["step"], d["type"]) for d in formatted["data_sources"]] == [
+            (1, "oews_database"),
+            (2, "web_search"),
+            (3, "synthesis"),
+        ]
+        assert formatted["data_sources"][0]["sql"] == "SELECT 1"
+        assert "EXECUTION_TRACE" not in state["messages"][0].content
+
     def test_formatter_handles_malformed_json_gracefully(self):
         """Test that malformed JSON in traces doesn't crash formatter."""
         # Invalid JSON in trace
@@ -279,5 +306,282 @@ class TestPerformanceOptimizations:
         assert trace["row_count"] == 100
 
 
+
+class TestCortexTracePairing:
+    """Test SQL tool calls are paired with their tool responses."""
+
+    def test_each_sql_call_paired_with_its_response(self):
+        """Test interleaved calls and responses are matched by tool_call_id."""
+        from src.workflow.graph import _run_cortex_researcher
+
+        def call(call_id, sql):
+            return {"name": "execute_sql_query", "id": call_id, "args": {"sql": sql, "params": "[]"}}
+
+        def response(call_id, value):
+            return ToolMessage(
+                content=json.dumps({"success": True, "columns": ["v"], "data": [[value]], "row_count": 1}),
+                tool_call_id=call_id,
+            )
+
+        agent = Mock()
+        agent.invoke.return_value = {"messages": [
+            AIMessage(content="", tool_calls=[call("a", "SELECT 1"), call("b", "SELECT 2")]),
+            response("b", 2),
+            response("a", 1),
+            AIMessage(content="", tool_calls=[call("c", "SELECT 3")]),
+            AIMessage(content="done"),
+        ]}
+
+        content, traces, succeeded = _run_cortex_researcher(agent, "q", Mock())
+
+        assert content == "done"
+        assert succeeded
+        assert [(t["sql"], t["sample_data"]) for t in traces] == [
+            ("SELECT 1", [{"v": 1}]),
+            ("SELECT 2", [{"v": 2}]),
+        ]
+
+    def test_traces_capped_per_answer(self, monkeypatch):
+        """Test only the first MAX_TRACES SQL calls are traced."""
+        from src.workflow import graph
+
+        monkeypatch.setattr(graph, "MAX_TRACES", 2)
+        messages = []
+        for i in range(4):
+            messages.append(AIMessage(content="", tool_calls=[
+                {"name": "execute_sql_query", "id": str(i), "args": {"sql": f"SELECT {i}"}}
+            ]))
+            messages.append(ToolMessage(content=json.dumps({"success": True}), tool_call_id=str(i)))
+        agent = Mock()
+        agent.invoke.return_value = {"messages": messages + [AIMessage(content="done")]}
+
+        _, traces, _ = graph._run_cortex_researcher(agent, "q", Mock())
+
+        assert [t["sql"] for t in traces] == ["SELECT 0", "SELECT 1"]
+
+
+class TestChartSummarizer:
+    """Test the chart summarizer keeps CHART_SPEC content intact."""
+
+    def test_summarizer_lists_chart_types_and_preserves_specs(self):
+        """Test chart types are listed and the original specs are kept for the formatter."""
+        content = (
+            'CHART_SPEC: {"type": "bar", "title": "Wages"}\n'
+            'CHART_SPEC: {"type": "line", "title": "Trend"}'
+        )
+        state = State(messages=[AIMessage(content=content, name="chart_generator")])
+
+        message = chart_summarizer_node(state).update["messages"][0]
+
+        assert message.content.startswith("Generated 2 chart(s): bar, line")
+        assert message.content.endswith(content)
+
+    def test_summarizer_ignores_types_before_first_spec(self):
+        """Test "type" fields in the preamble are not counted as charts."""
+        content = (
+            'Query returned {"type": "table"} rows.\n'
+            'CHART_SPEC: {"type": "bar", "title": "Wages"}'
+        )
+        state = State(messages=[AIMessage(content=content, name="chart_generator")])
+
+        message = chart_summarizer_node(state).update["messages"][0]
+
+        assert message.content.startswith("Generated 1 chart(s): bar")
+
+    def test_summarizer_without_chart_specs(self):
+        """Test messages without CHART_SPEC produce the no-charts summary."""
+        state = State(messages=[AIMessage(content="nothing to plot", name="chart_generator")])
+
+        message = chart_summarizer_node(state).update["messages"][0]
+
+        assert message.content == "No charts were generated."
+
+
+class TestAgentReuse:
+    """Test workflow nodes reuse agents across invocations."""
+
+    def test_chart_generator_agent_built_once_per_model(self, monkeypatch):
+        """Test the node builds one agent per model override and reuses it."""
+        from src.workflow import graph
+
+        built = []
+
+        def fake_factory(override_key=None):
+            built.append(override_key)
+            agent = Mock()
+            agent.invoke.return_value = {"messages": [AIMessage(content="CHART_SPEC: {}")]}
+            return agent
+
+        monkeypatch.setattr(graph, "create_chart_generator_agent", fake_factory)
+        graph._get_agent.cache_clear()
+        graph.clear_agent_result_cache()
+
+        try:
+            for model in (None, None, "gpt-4o", None):
+                graph.chart_generator_node(State(implementation_model=model, user_query="q"))
+        finally:
+            graph._get_agent.cache_clear()
+            graph.clear_agent_result_cache()
+
+        assert built == [None, "gpt-4o"]
+
+    def test_workflow_graph_compiled_once(self):
+        """Test repeated calls return the same compiled graph."""
+        from src.workflow.graph import create_workflow_graph
+
+        assert create_workflow_graph() is create_workflow_graph()
+
+
+class TestAgentResultCache:
+    """Test researcher nodes reuse answers for repeated queries."""
+
+    @pytest.fixture
+    def web_agent(self, monkeypatch):
+        from src.workflow import graph
+
+        agent = Mock()
+        agent.invoke.return_value = {
+            "messages": [AIMessage(content="answer")],
+            "intermediate_steps": [("tavily_search", "result")],
+        }
+        monkeypatch.setattr(graph, "create_web_research_agent", lambda override_key=None: agent)
+        graph._get_agent.cache_clear()
+        graph.clear_agent_result_cache()
+        yield agent
+        graph._get_agent.cache_clear()
+        graph.clear_agent_result_cache()
+
+    def test_repeated_query_invokes_agent_once(self, web_agent):
+        """Test an identical query is answered from the cache."""
+        from src.workflow.graph import web_researcher_node
+
+        state = State(user_query="Population of Seattle", messages=[])
+        first = web_researcher_node(state)
+        second = web_researcher_node(state)
+
+        assert web_agent.invoke.call_count == 1
+        assert first.update["messages"][0].content == second.update["messages"][0].content
+
+    def test_chart_generator_reuses_chart_specs(self, monkeypatch):
+        """Test a repeated chart request reuses the earlier chart specs."""
+        from src.workflow import graph
+
+        agent = Mock()
+        agent.invoke.return_value = {"messages": [AIMessage(content='CHART_SPEC: {"type": "bar"}')]}
+        monkeypatch.setattr(graph, "create_chart_generator_agent", lambda override_key=None: agent)
+        graph._get_agent.cache_clear()
+        graph.clear_agent_result_cache()
+
+        state = State(agent_query="Chart Seattle wages", messages=[])
+        try:
+            first = graph.chart_generator_node(state)
+            second = graph.chart_generator_node(state)
+        finally:
+            graph._get_agent.cache_clear()
+            graph.clear_agent_result_cache()
+
+        assert agent.invoke.call_count == 1
+        assert first.update["messages"][0].content == second.update["messages"][0].content
+        assert second.update["messages"][0].additional_kwargs["execution_trace"]["chart_count"] == 1
+
+    def test_time_sensitive_query_not_cached(self, web_agent):
+        """Test queries about the present always reach the agent."""
+        from src.workflow.graph import web_researcher_node
+
+        state = State(user_query="Latest population of Seattle", messages=[])
+        web_researcher_node(state)
+        web_researcher_node(state)
+
+        assert web_agent.invoke.call_count == 2
+
+    def test_answer_without_tool_results_not_cached(self, web_agent):
+        """Test answers that never ran a tool are retried next time."""
+        from src.workflow.graph import web_researcher_node
+
+        web_agent.invoke.return_value = {"messages": [AIMessage(content="no data")]}
+        state = State(user_query="Population of Seattle", messages=[])
+        web_researcher_node(state)
+        web_researcher_node(state)
+
+        assert web_agent.invoke.call_count == 2
+
+
+class TestParallelResearch:
+    """Test consecutive research steps run together."""
+
+    PLAN = {
+        "1": {"agent": "cortex_researcher", "action": "Query wages"},
+        "2": {"agent": "web_researcher", "action": "Look up cost of living"},
+        "3": {"agent": "synthesizer", "action": "Summarize"},
+    }
+
+    def test_executor_batches_consecutive_research_steps(self):
+        """Test the executor routes adjacent research steps to one parallel node."""
+        from src.agents.executor import executor_node
+
+        command = executor_node(State(plan=self.PLAN, current_step=1, user_query="q", messages=[]))
+
+        assert command.goto == "parallel_researchers"
+        assert command.update["current_step"] == 2
+        assert [t["agent"] for t in command.update["agent_queries"]] == ["cortex_researcher", "web_researcher"]
+
+    def test_parallel_node_returns_answers_in_plan_order(self, monkeypatch):
+        """Test both agents run and their messages keep plan order."""
+        from src.workflow import graph
+
+        def fake_runner(answer):
+            return lambda agent, query, logger: (f"{answer}: {query}", None, False)
+
+        monkeypatch.setattr(graph, "_run_cortex_researcher", fake_runner("sql"))
+        monkeypatch.setattr(graph, "_run_web_researcher", fake_runner("web"))
+        monkeypatch.setattr(graph, "create_text2sql_agent", lambda override_key=None: Mock())
+        monkeypatch.setattr(graph, "create_web_research_agent", lambda override_key=None: Mock())
+        graph._get_agent.cache_clear()
+
+        tasks = [
+            {"step": 1, "agent": "cortex_researcher", "query": "wages"},
+            {"step": 2, "agent": "web_researcher", "query": "rent"},
+        ]
+        try:
+            command = graph.parallel_researchers_node(State(agent_queries=tasks, messages=[]))
+        finally:
+            graph._get_agent.cache_clear()
+
+        messages = command.update["messages"]
+        assert [(m.name, m.content) for m in messages] == [
+            ("cortex_researcher", "sql: wages"),
+            ("web_researcher", "web: rent"),
+        ]
+        assert command.goto == "executor"
+        assert set(command.update["model_usage"]) == {"cortex_researcher", "web_researcher"}
+
+
+    def test_parallel_node_keeps_answers_when_one_branch_fails(self, monkeypatch):
+        """Test a failing agent becomes an error message without losing the other answer."""
+        from src.workflow import graph
+
+        def failing_runner(agent, query, logger):
+            raise RuntimeError("search quota exceeded")
+
+        monkeypatch.setattr(graph, "_run_cortex_researcher", lambda agent, query, logger: ("rows", None, False))
+        monkeypatch.setattr(graph, "_run_web_researcher", failing_runner)
+        monkeypatch.setattr(graph, "create_text2sql_agent", lambda override_key=None: Mock())
+        monkeypatch.setattr(graph, "create_web_research_agent", lambda override_key=None: Mock())
+        graph._get_agent.cache_clear()
+
+        tasks = [
+            {"step": 1, "agent": "cortex_researcher", "query": "wages"},
+            {"step": 2, "agent": "web_researcher", "query": "rent"},
+        ]
+        try:
+            command = graph.parallel_researchers_node(State(agent_queries=tasks, messages=[]))
+        finally:
+            graph._get_agent.cache_clear()
+
+        first, second = command.update["messages"]
+        assert first.content == "rows"
+        assert second.name == "web_researcher"
+        assert "search quota exceeded" in second.content
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,7 +1,9 @@
 """Tests for trace utilities."""
 
 import pytest
-from src.utils.trace_utils import calculate_column_stats, build_sql_trace
+import json
+import numpy as np
+from src.utils.trace_utils import MAX_SAMPLE_FIELD_LEN, calculate_column_stats, build_sql_trace, serialize_trace
 
 
 def test_calculate_column_stats_numeric():
@@ -20,6 +22,21 @@ def test_calculate_column_stats_numeric():
     assert stats["mean"] == 60000
 
 
+def test_calculate_column_stats_unordered_with_gaps():
+    """Test min/max/mean skip nulls and non-numeric values in any order."""
+    rows = [
+        {"wage": "75000"},
+        {"wage": None},
+        {"wage": 40000},
+        {"wage": "N/A"},
+        {"wage": 95000.0},
+    ]
+
+    stats = calculate_column_stats(rows, "wage")
+
+    assert stats == {"min": 40000.0, "max": 95000.0, "mean": 70000.0, "count": 3}
+
+
 def test_calculate_column_stats_non_numeric():
     """Test that non-numeric columns return None."""
     rows = [
@@ -32,6 +49,22 @@ def test_calculate_column_stats_non_numeric():
     assert stats is None
 
 
+def test_calculate_column_stats_leading_non_numeric_rows():
+    """Test a column that starts with text but is half numeric keeps its stats."""
+    rows = [{"wage": "*"}] * 4 + [{"wage": 10}, {"wage": 20}, {"wage": 30}, {"wage": 40}]
+
+    stats = calculate_column_stats(rows, "wage")
+
+    assert stats == {"min": 10.0, "max": 40.0, "mean": 25.0, "count": 4}
+
+
+def test_calculate_column_stats_mostly_non_numeric():
+    """Test that a column below 50% numeric returns None."""
+    rows = [{"wage": "*"}] * 5 + [{"wage": 10}] * 4
+
+    assert calculate_column_stats(rows, "wage") is None
+
+
 def test_calculate_column_stats_empty_rows():
     """Test empty rows return None."""
     stats = calculate_column_stats([], "salary")
@@ -78,6 +111,17 @@ def test_build_sql_trace_limits_sample_data():
     assert len(trace["sample_data"]) == 10
 
 
+def test_build_sql_trace_truncates_long_sample_fields():
+    """Test that long strings in sample rows are shortened."""
+    rows = [{"id": 1, "text": "x" * 2000}, {"id": 2, "text": "short"}]
+
+    trace = build_sql_trace("SELECT * FROM test", [], rows)
+
+    assert trace["sample_data"][0]["text"] == "x" * MAX_SAMPLE_FIELD_LEN + "..."
+    assert trace["sample_data"][1] == {"id": 2, "text": "short"}
+    assert rows[0]["text"] == "x" * 2000
+
+
 def test_build_sql_trace_no_stats_for_non_numeric():
     """Test that non-numeric columns don't produce stats."""
     sql = "SELECT name FROM users"
@@ -87,3 +131,13 @@ def test_build_sql_trace_no_stats_for_non_numeric():
     trace = build_sql_trace(sql, params, rows)
 
     assert trace["stats"] is None
+
+
+def test_serialize_trace_handles_numpy_scalars():
+    """Test trace serialization is compact JSON and accepts numpy values."""
+    trace = build_sql_trace("SELECT 1", [], [{"wage": np.float64(1.5), "n": np.int64(2)}])
+
+    payload = serialize_trace([trace])
+
+    assert " " not in payload.replace("SELECT 1", "")
+    assert json.loads(payload)[0]["sample_data"] == [{"wage": 1.5, "n": 2}]
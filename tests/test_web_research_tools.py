@@ -52,3 +52,40 @@ def test_tavily_search_requires_api_key():
         # Restore key
         if old_key:
             os.environ['TAVILY_API_KEY'] = old_key
+
+
+def test_tavily_client_is_reused_across_searches(monkeypatch):
+    """Test one client (and HTTP session) serves sync and async searches."""
+    import asyncio
+    import tavily
+    from src.tools import web_research_tools
+    from src.tools.web_research_tools import get_cost_of_living_data, get_population_data
+
+    created = []
+
+    class FakeTavilyClient:
+        def __init__(self, api_key):
+            created.append(api_key)
+
+        def search(self, query, **kwargs):
+            return {"results": [{"title": query, "url": "https://example.com", "content": "text"}]}
+
+    monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+    monkeypatch.setattr(tavily, "TavilyClient", FakeTavilyClient)
+    web_research_tools._tavily_client.cache_clear()
+
+    async def paired_lookups():
+        return await asyncio.gather(
+            get_population_data.ainvoke({"location": "Seattle"}),
+            get_cost_of_living_data.ainvoke({"location": "Seattle"}),
+        )
+
+    try:
+        tavily_search.invoke({"query": "Seattle median income"})
+        population, cost = asyncio.run(paired_lookups())
+    finally:
+        web_research_tools._tavily_client.cache_clear()
+
+    assert created == ["test-key"]
+    assert "Seattle population 2024 census data" in population
+    assert "Seattle cost of living index 2024" in cost